@@ -4,7 +4,7 @@ Pricing calculation endpoints.
 This is the CORE of the platform - calculating FX option prices
 using the Garman-Kohlhagen model.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.pricing import PricingRequest, PricingResponse
@@ -19,7 +19,11 @@ volatility_service = VolatilityService()
 
 
 @router.post("/calculate", response_model=PricingResponse)
-async def calculate_pricing(pricing_request: PricingRequest, db: AsyncSession = Depends(get_db)):
+async def calculate_pricing(
+    pricing_request: PricingRequest,
+    dense: bool = Query(True, description="Include the 50-point payoff_curve sample"),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Calculate FX option price with full analytics.
 
@@ -28,6 +32,9 @@ async def calculate_pricing(pricing_request: PricingRequest, db: AsyncSession =
     2. Calculates option price using Garman-Kohlhagen formula
     3. Returns price, Greeks, scenarios, and payoff curve data
 
+    Pass dense=false to skip the 50-point payoff_curve sample; the exact
+    3-point payoff_curve_piecewise is always returned.
+
     This is THE MOST IMPORTANT endpoint for the investor demo.
 
     Example request body:
@@ -57,6 +64,7 @@ async def calculate_pricing(pricing_request: PricingRequest, db: AsyncSession =
         notional_amount=pricing_request.notional_amount,
         option_type=pricing_request.option_type,
         protection_level=pricing_request.protection_level,
+        dense=dense,
     )
 
     return result
@@ -70,6 +78,7 @@ async def calculate_pricing_auto(
     notional_amount: float,
     option_type: str = "call",
     protection_level: float = 0.05,
+    dense: bool = Query(True, description="Include the 50-point payoff_curve sample"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -123,6 +132,7 @@ async def calculate_pricing_auto(
         notional_amount=notional_amount,
         option_type=option_type,
         protection_level=protection_level,
+        dense=dense,
     )
 
     return result
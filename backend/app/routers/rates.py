@@ -1,7 +1,7 @@
 """
 Exchange rate endpoints.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from app.database import get_db
@@ -13,6 +13,7 @@ exchange_rate_service = ExchangeRateService()
 
 @router.get("/current")
 async def get_current_rate(
+    response: Response,
     base: str = Query(..., description="Base currency code"),
     quote: str = Query(..., description="Quote currency code"),
     force_refresh: bool = Query(False, description="Force refresh from API"),
@@ -22,8 +23,12 @@ async def get_current_rate(
     Get current exchange rate for a currency pair.
 
     Returns the latest rate, fetching from API if not cached or if force_refresh=True.
+    The X-Cache response header is HIT when served from the cache, MISS otherwise.
     """
-    rate = await exchange_rate_service.get_current_rate(base, quote, db, force_refresh)
+    rate, cache_hit = await exchange_rate_service.get_current_rate_with_cache_status(
+        base, quote, db, force_refresh
+    )
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
 
     return {
         "base_currency": base,
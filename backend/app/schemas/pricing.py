@@ -71,8 +71,11 @@ class PricingResponse(BaseModel):
     # Scenario analysis (5 scenarios: -10%, -5%, 0%, +5%, +10%)
     scenarios: list[ScenarioAnalysis]
 
-    # Payoff curve data (for charting)
+    # Payoff curve data (for charting); empty when requested with dense=False
     payoff_curve: list[PayoffCurvePoint]
 
+    # Exact piecewise-linear payoff: range low, kink at strike, range high
+    payoff_curve_piecewise: list[PayoffCurvePoint]
+
     # Break-even rate
     breakeven_rate: float
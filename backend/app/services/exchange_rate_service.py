@@ -2,7 +2,8 @@
 Exchange rate service - coordinates data providers and database storage.
 """
 from datetime import date, datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from app.models.exchange_rate import ExchangeRate
@@ -32,6 +33,24 @@ class ExchangeRateService:
         Returns:
             Exchange rate (quote per base)
         """
+        rate, _ = await self.get_current_rate_with_cache_status(base, quote, db, force_refresh)
+        return rate
+
+    async def get_current_rate_with_cache_status(
+        self, base: str, quote: str, db: AsyncSession, force_refresh: bool = False
+    ) -> Tuple[float, bool]:
+        """
+        Get current exchange rate and whether it was served from the cache.
+
+        Args:
+            base: Base currency code
+            quote: Quote currency code
+            db: Database session
+            force_refresh: If True, fetch from API even if cached
+
+        Returns:
+            Tuple of (exchange rate, True if served from the database cache)
+        """
         # Check cache (rates from last 1 hour)
         if not force_refresh:
             one_hour_ago = datetime.utcnow() - timedelta(hours=1)
@@ -52,7 +71,7 @@ class ExchangeRateService:
             cached_rate = result.scalar_one_or_none()
 
             if cached_rate:
-                return float(cached_rate.rate)
+                return float(cached_rate.rate), True
 
         # Fetch from API
         rate = await self.provider.get_current_rate(base, quote)
@@ -68,7 +87,22 @@ class ExchangeRateService:
         db.add(db_rate)
         await db.commit()
 
-        return rate
+        return rate, False
+
+    @staticmethod
+    def _historical_window(base: str, quote: str, start_date: date, end_date: date):
+        """WHERE clause selecting stored rates for a pair within [start_date, end_date]."""
+        return and_(
+            ExchangeRate.base_currency == base,
+            ExchangeRate.quote_currency == quote,
+            ExchangeRate.timestamp >= datetime.combine(start_date, datetime.min.time()),
+            ExchangeRate.timestamp <= datetime.combine(end_date, datetime.max.time()),
+        )
+
+    @staticmethod
+    def _has_coverage(n_rates: int, start_date: date, end_date: date) -> bool:
+        """True when the stored rates cover at least 80% of the days in the range."""
+        return n_rates >= (end_date - start_date).days * 0.8
 
     async def get_historical_rates(
         self, base: str, quote: str, start_date: date, end_date: date, db: AsyncSession
@@ -91,14 +125,7 @@ class ExchangeRateService:
         # Query database for existing rates
         stmt = (
             select(ExchangeRate)
-            .where(
-                and_(
-                    ExchangeRate.base_currency == base,
-                    ExchangeRate.quote_currency == quote,
-                    ExchangeRate.timestamp >= datetime.combine(start_date, datetime.min.time()),
-                    ExchangeRate.timestamp <= datetime.combine(end_date, datetime.max.time()),
-                )
-            )
+            .where(self._historical_window(base, quote, start_date, end_date))
             .order_by(ExchangeRate.timestamp)
         )
 
@@ -106,10 +133,16 @@ class ExchangeRateService:
         db_rates = result.scalars().all()
 
         # If we have enough data, return from cache
-        if len(db_rates) >= (end_date - start_date).days * 0.8:  # 80% coverage
+        if self._has_coverage(len(db_rates), start_date, end_date):
             return [{"date": r.timestamp.date(), "rate": float(r.rate)} for r in db_rates]
 
         # Otherwise, fetch from API
+        return await self._fetch_and_store_historical(base, quote, start_date, end_date, db)
+
+    async def _fetch_and_store_historical(
+        self, base: str, quote: str, start_date: date, end_date: date, db: AsyncSession
+    ) -> List[dict]:
+        """Fetch historical rates from the provider and store them in the database."""
         api_rates = await self.provider.get_historical_rates(base, quote, start_date, end_date)
 
         # Store new rates in database
@@ -127,6 +160,49 @@ class ExchangeRateService:
 
         return api_rates
 
+    async def get_historical_rates_arrays(
+        self, base: str, quote: str, start_date: date, end_date: date, db: AsyncSession
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get historical exchange rates as date-sorted NumPy arrays.
+
+        Same data as get_historical_rates, but reads only the timestamp and
+        rate columns and skips building a dict per row.
+
+        Args:
+            base: Base currency code
+            quote: Quote currency code
+            start_date: Start date
+            end_date: End date
+            db: Database session
+
+        Returns:
+            Tuple of (dates as datetime64[D], rates as float64), sorted by date
+        """
+        stmt = (
+            select(ExchangeRate.timestamp, ExchangeRate.rate)
+            .where(self._historical_window(base, quote, start_date, end_date))
+            .order_by(ExchangeRate.timestamp)
+        )
+
+        result = await db.execute(stmt)
+        rows = result.all()
+
+        # If we have enough data, return from cache
+        if self._has_coverage(len(rows), start_date, end_date):
+            dates = np.fromiter((row.timestamp.date() for row in rows), dtype="datetime64[D]", count=len(rows))
+            rates = np.fromiter((row.rate for row in rows), dtype=np.float64, count=len(rows))
+            return dates, rates
+
+        # Otherwise, fetch from API (which also stores the rates)
+        api_rates = await self._fetch_and_store_historical(base, quote, start_date, end_date, db)
+
+        dates = np.fromiter((r["date"] for r in api_rates), dtype="datetime64[D]", count=len(api_rates))
+        rates = np.fromiter((r["rate"] for r in api_rates), dtype=np.float64, count=len(api_rates))
+        order = np.argsort(dates, kind="stable")
+
+        return dates[order], rates[order]
+
     async def refresh_rate(self, base: str, quote: str, db: AsyncSession) -> float:
         """Force refresh rate from API."""
         return await self.get_current_rate(base, quote, db, force_refresh=True)
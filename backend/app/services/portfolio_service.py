@@ -4,10 +4,11 @@ Portfolio analytics service.
 Aggregates positions, calculates netting opportunities,
 and provides portfolio-level risk metrics.
 """
+from dataclasses import dataclass
 from typing import List
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, case, and_
 from app.models.transaction import Transaction, TransactionType
 from app.models.hedge import Hedge, HedgeStatus
 from app.models.portfolio_position import PortfolioPosition
@@ -17,6 +18,37 @@ from app.schemas.portfolio import (
     NettingOpportunity,
 )
 
+# Rows fetched per round-trip when streaming transactions
+STREAM_BATCH_SIZE = 1000
+
+# Imports are long foreign currency, exports are short
+_SIGN = {
+    TransactionType.IMPORT: Decimal(1),
+    TransactionType.EXPORT: Decimal(-1),
+}
+
+
+@dataclass(slots=True)
+class _ExposureAccum:
+    """Running totals for one currency pair while aggregating exposures."""
+
+    net_exposure: Decimal = Decimal("0")
+    notional_amount: Decimal = Decimal("0")
+    hedge_count: int = 0
+    total_premium: Decimal = Decimal("0")
+    total_strike_weighted: float = 0.0
+    total_notional_for_strike: Decimal = Decimal("0")
+
+
+def _exposure_columns_stmt():
+    """Select only the transaction columns needed for exposure aggregation."""
+    return select(
+        Transaction.foreign_currency,
+        Transaction.functional_currency,
+        Transaction.transaction_type,
+        Transaction.notional_amount,
+    ).execution_options(yield_per=STREAM_BATCH_SIZE)
+
 
 class PortfolioService:
     """Service for portfolio analytics."""
@@ -84,34 +116,21 @@ class PortfolioService:
         Returns:
             List of PortfolioExposure
         """
-        # Query all transactions with their hedges
-        transactions_stmt = select(Transaction)
-        transactions_result = await db.execute(transactions_stmt)
-        transactions = transactions_result.scalars().all()
+        # Stream only the columns we aggregate; skips ORM materialization
+        transactions_result = await db.stream(_exposure_columns_stmt())
 
         # Group by currency pair
         exposures_dict = {}
 
-        for txn in transactions:
+        async for txn in transactions_result:
             currency_pair = f"{txn.foreign_currency}{txn.functional_currency}"
 
-            if currency_pair not in exposures_dict:
-                exposures_dict[currency_pair] = {
-                    "net_exposure": Decimal("0"),
-                    "notional_amount": Decimal("0"),
-                    "hedge_count": 0,
-                    "total_premium": Decimal("0"),
-                    "total_strike_weighted": 0.0,
-                    "total_notional_for_strike": Decimal("0"),
-                }
-
-            # Update exposure (imports are long foreign currency, exports are short)
-            if txn.transaction_type == TransactionType.IMPORT:
-                exposures_dict[currency_pair]["net_exposure"] += txn.notional_amount
-            else:
-                exposures_dict[currency_pair]["net_exposure"] -= txn.notional_amount
+            accum = exposures_dict.get(currency_pair)
+            if accum is None:
+                accum = exposures_dict[currency_pair] = _ExposureAccum()
 
-            exposures_dict[currency_pair]["notional_amount"] += txn.notional_amount
+            accum.net_exposure += _SIGN[txn.transaction_type] * txn.notional_amount
+            accum.notional_amount += txn.notional_amount
 
         # Get hedge data
         hedges_stmt = select(Hedge)
@@ -126,31 +145,30 @@ class PortfolioService:
 
             if txn:
                 currency_pair = f"{txn.foreign_currency}{txn.functional_currency}"
-                if currency_pair in exposures_dict:
-                    exposures_dict[currency_pair]["hedge_count"] += 1
-                    exposures_dict[currency_pair]["total_premium"] += hedge.total_option_cost
-                    exposures_dict[currency_pair]["total_strike_weighted"] += float(
-                        hedge.strike_price * txn.notional_amount
-                    )
-                    exposures_dict[currency_pair]["total_notional_for_strike"] += txn.notional_amount
+                accum = exposures_dict.get(currency_pair)
+                if accum is not None:
+                    accum.hedge_count += 1
+                    accum.total_premium += hedge.total_option_cost
+                    accum.total_strike_weighted += float(hedge.strike_price * txn.notional_amount)
+                    accum.total_notional_for_strike += txn.notional_amount
 
         # Convert to PortfolioExposure objects
         exposures = []
         for currency_pair, data in exposures_dict.items():
             # Calculate average strike
-            if data["total_notional_for_strike"] > 0:
-                avg_strike = data["total_strike_weighted"] / float(data["total_notional_for_strike"])
+            if data.total_notional_for_strike > 0:
+                avg_strike = data.total_strike_weighted / float(data.total_notional_for_strike)
             else:
                 avg_strike = 0.0
 
             exposures.append(
                 PortfolioExposure(
                     currency_pair=currency_pair,
-                    net_exposure=data["net_exposure"],
-                    total_hedges=data["hedge_count"],
-                    total_premium_paid=data["total_premium"],
+                    net_exposure=data.net_exposure,
+                    total_hedges=data.hedge_count,
+                    total_premium_paid=data.total_premium,
                     average_strike=avg_strike,
-                    total_notional=data["notional_amount"],
+                    total_notional=data.notional_amount,
                 )
             )
 
@@ -169,44 +187,45 @@ class PortfolioService:
         Returns:
             List of NettingOpportunity
         """
-        # Query transactions grouped by currency pair and type
-        transactions_stmt = select(Transaction)
-        transactions_result = await db.execute(transactions_stmt)
-        transactions = transactions_result.scalars().all()
-
-        # Group by currency pair
-        positions = {}
+        # Sum long (import) and short (export) notional per currency pair in
+        # a single scan, keeping only pairs that have both sides
+        long_sum = func.sum(
+            case((Transaction.transaction_type == TransactionType.IMPORT, Transaction.notional_amount), else_=0)
+        )
+        short_sum = func.sum(
+            case((Transaction.transaction_type == TransactionType.EXPORT, Transaction.notional_amount), else_=0)
+        )
 
-        for txn in transactions:
-            currency_pair = f"{txn.foreign_currency}{txn.functional_currency}"
+        positions_stmt = (
+            select(
+                Transaction.foreign_currency,
+                Transaction.functional_currency,
+                long_sum.label("long_exposure"),
+                short_sum.label("short_exposure"),
+            )
+            .group_by(Transaction.foreign_currency, Transaction.functional_currency)
+            .having(and_(long_sum > 0, short_sum > 0))
+        )
+        positions_result = await db.execute(positions_stmt)
 
-            if currency_pair not in positions:
-                positions[currency_pair] = {"long": Decimal("0"), "short": Decimal("0")}
+        # Build netting opportunities directly from the aggregated rows
+        opportunities = []
 
-            if txn.transaction_type == TransactionType.IMPORT:
-                positions[currency_pair]["long"] += txn.notional_amount
-            else:
-                positions[currency_pair]["short"] += txn.notional_amount
+        for pos in positions_result:
+            netting_amount = min(pos.long_exposure, pos.short_exposure)
 
-        # Find netting opportunities
-        opportunities = []
+            # Estimate savings (assume 2% hedging cost on netted amount)
+            potential_savings = netting_amount * Decimal("0.02")
 
-        for currency_pair, pos in positions.items():
-            if pos["long"] > 0 and pos["short"] > 0:
-                netting_amount = min(pos["long"], pos["short"])
-
-                # Estimate savings (assume 2% hedging cost on netted amount)
-                potential_savings = netting_amount * Decimal("0.02")
-
-                opportunities.append(
-                    NettingOpportunity(
-                        currency_pair=currency_pair,
-                        long_exposure=pos["long"],
-                        short_exposure=pos["short"],
-                        netting_amount=netting_amount,
-                        potential_savings=potential_savings,
-                    )
+            opportunities.append(
+                NettingOpportunity(
+                    currency_pair=f"{pos.foreign_currency}{pos.functional_currency}",
+                    long_exposure=pos.long_exposure,
+                    short_exposure=pos.short_exposure,
+                    netting_amount=netting_amount,
+                    potential_savings=potential_savings,
                 )
+            )
 
         return opportunities
 
@@ -8,16 +8,113 @@ Reference:
 Garman, M.B. and Kohlhagen, S.W. (1983) "Foreign Currency Option Values"
 Journal of International Money and Finance, 2, 231-237.
 """
-from typing import Dict, List
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
 import numpy as np
-from decimal import Decimal
-from app.utils.math_utils import cumulative_normal, probability_density_normal, generate_gbm_paths
-from app.schemas.pricing import (
-    PricingResponse,
-    Greeks,
-    ScenarioAnalysis,
-    PayoffCurvePoint,
+from app.utils.math_utils import (
+    black_scholes_greeks_batch,
+    cumulative_normal,
+    garman_kohlhagen,
+    garman_kohlhagen_d1_d2,
+    probability_density_normal,
 )
+from app.schemas.pricing import PricingResponse, Greeks
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; calculate_call_option falls back to NumPy
+    njit = None
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _gk_call_kernel(spot_rate, strike_price, time_to_maturity_years, volatility, domestic_rate, foreign_rate):
+        """Compiled Garman-Kohlhagen call: (price, d1, d2, delta, gamma, vega, theta_daily)."""
+        sqrt_T = math.sqrt(time_to_maturity_years)
+        vol_sqrt_T = volatility * sqrt_T
+
+        discount_foreign = math.exp(-foreign_rate * time_to_maturity_years)
+        discount_domestic = math.exp(-domestic_rate * time_to_maturity_years)
+
+        d1 = math.log((spot_rate * discount_foreign) / (strike_price * discount_domestic)) / vol_sqrt_T + vol_sqrt_T / 2
+        d2 = d1 - vol_sqrt_T
+
+        # N(x) = erfc(-x / sqrt(2)) / 2, accurate in both tails like ndtr
+        N_d1 = 0.5 * math.erfc(-d1 / math.sqrt(2.0))
+        N_d2 = 0.5 * math.erfc(-d2 / math.sqrt(2.0))
+        pdf_d1 = math.exp(-0.5 * d1 * d1) / math.sqrt(2.0 * math.pi)
+
+        option_price = discount_foreign * spot_rate * N_d1 - strike_price * discount_domestic * N_d2
+
+        delta = discount_foreign * N_d1
+        gamma = (discount_foreign * pdf_d1) / (spot_rate * vol_sqrt_T)
+        vega = spot_rate * discount_foreign * pdf_d1 * sqrt_T
+        theta_annual = (
+            -(spot_rate * pdf_d1 * volatility * discount_foreign) / (2 * sqrt_T)
+            + foreign_rate * spot_rate * N_d1 * discount_foreign
+            - domestic_rate * strike_price * discount_domestic * N_d2
+        )
+        return option_price, d1, d2, delta, gamma, vega, theta_annual / 365
+
+    # Compile (or load from the on-disk cache) at import so the first
+    # request doesn't pay the JIT cost
+    _gk_call_kernel(1.0, 1.0, 1.0, 0.2, 0.0, 0.0)
+else:
+    _gk_call_kernel = None
+
+
+@dataclass(slots=True, frozen=True)
+class GreeksResult:
+    """Greeks of a single priced option (vega per 1% vol, theta per day)."""
+
+    delta: float
+    gamma: float
+    vega: float
+    theta: float
+
+
+@dataclass(slots=True, frozen=True)
+class OptionResult:
+    """Price, d1/d2 and Greeks of a single priced option."""
+
+    option_price: float
+    d1: float
+    d2: float
+    greeks: GreeksResult
+
+
+# Deterministic spot shocks for the scenario analysis (-10%, -5%, 0%, +5%, +10%)
+SCENARIO_SHOCKS = np.array([-0.10, -0.05, 0.0, 0.05, 0.10])
+SCENARIO_SHOCKS.setflags(write=False)
+
+
+@lru_cache(maxsize=128)
+def _build_grid(spot_rate: float, strike_price: float, dense: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Spot grid used by price_with_analytics, cached per (spot, strike, dense).
+
+    Returns (scenario_spots, curve_spots, all_spots) as read-only arrays;
+    all_spots is scenario_spots followed by curve_spots so payoffs for both
+    come from one vectorized pass.
+    """
+    scenario_spots = spot_rate * (1 + SCENARIO_SHOCKS)
+
+    # Payoff curve spots: dense sample for charting, plus the range
+    # endpoints and the kink at the strike. The payoff is piecewise-linear
+    # with a single kink, so those three points describe it exactly
+    low_spot = spot_rate * 0.85
+    high_spot = spot_rate * 1.15
+    kink_spot = min(max(strike_price, low_spot), high_spot)
+    dense_spots = np.linspace(low_spot, high_spot, 50) if dense else np.empty(0)
+    curve_spots = np.concatenate([dense_spots, [low_spot, kink_spot, high_spot]])
+
+    all_spots = np.concatenate([scenario_spots, curve_spots])
+    for grid in (scenario_spots, curve_spots, all_spots):
+        grid.setflags(write=False)
+    return scenario_spots, curve_spots, all_spots
 
 
 class GarmanKohlhagenPricer:
@@ -28,6 +125,9 @@ class GarmanKohlhagenPricer:
     the foreign risk-free rate (treating foreign currency like a dividend-paying stock).
     """
 
+    # Compiled scalar call kernel (None without numba)
+    _kernel_njit = _gk_call_kernel
+
     @staticmethod
     def calculate_call_option(
         spot_rate: float,
@@ -36,7 +136,7 @@ class GarmanKohlhagenPricer:
         volatility: float,
         domestic_rate: float,
         foreign_rate: float,
-    ) -> Dict:
+    ) -> OptionResult:
         """
         Calculate FX call option price using Garman-Kohlhagen formula.
 
@@ -59,40 +159,63 @@ class GarmanKohlhagenPricer:
             foreign_rate: Foreign risk-free rate (e.g., 0.07 for 7%)
 
         Returns:
-            Dictionary with option_price, d1, d2, and greeks
+            OptionResult with option_price, d1, d2, and greeks
         """
         # Handle edge case: expired option
         if time_to_maturity_years <= 0:
             intrinsic_value = max(0, spot_rate - strike_price)
-            return {
-                "option_price": intrinsic_value,
-                "d1": 0,
-                "d2": 0,
-                "greeks": {"delta": 1 if spot_rate > strike_price else 0, "gamma": 0, "vega": 0, "theta": 0},
-            }
+            return OptionResult(
+                option_price=intrinsic_value,
+                d1=0,
+                d2=0,
+                greeks=GreeksResult(delta=1 if spot_rate > strike_price else 0, gamma=0, vega=0, theta=0),
+            )
 
-        # Calculate d1 and d2 according to the exact formula
-        sqrt_T = np.sqrt(time_to_maturity_years)
+        if GarmanKohlhagenPricer._kernel_njit is not None:
+            option_price, d1, d2, delta, gamma, vega, theta_daily = GarmanKohlhagenPricer._kernel_njit(
+                float(spot_rate),
+                float(strike_price),
+                float(time_to_maturity_years),
+                float(volatility),
+                float(domestic_rate),
+                float(foreign_rate),
+            )
+            return OptionResult(
+                option_price=option_price,
+                d1=d1,
+                d2=d2,
+                greeks=GreeksResult(
+                    delta=delta,
+                    gamma=gamma,
+                    vega=vega / 100,  # Per 1% change in volatility
+                    theta=theta_daily,
+                ),
+            )
+
+        # Shared intermediates: each exp/sqrt/log/N(x) is evaluated once and
+        # reused by both the price and the Greeks
+        sqrt_T = math.sqrt(time_to_maturity_years)
         vol_sqrt_T = volatility * sqrt_T
 
-        # Forward rates with continuous compounding
-        forward_spot = spot_rate * np.exp(-foreign_rate * time_to_maturity_years)
-        forward_strike = strike_price * np.exp(-domestic_rate * time_to_maturity_years)
+        # Discount factors with continuous compounding
+        discount_foreign = math.exp(-foreign_rate * time_to_maturity_years)
+        discount_domestic = math.exp(-domestic_rate * time_to_maturity_years)
+
+        # Forward rates
+        forward_spot = spot_rate * discount_foreign
+        forward_strike = strike_price * discount_domestic
 
         # d1 calculation
-        numerator = np.log(forward_spot / forward_strike)
+        numerator = math.log(forward_spot / forward_strike)
         d1 = (numerator / vol_sqrt_T) + (vol_sqrt_T / 2)
 
         # d2 calculation
         d2 = d1 - vol_sqrt_T
 
-        # Calculate option price
+        # Calculate option price (scalar N(x) calls; no array round-trip)
         N_d1 = cumulative_normal(d1)
         N_d2 = cumulative_normal(d2)
 
-        discount_foreign = np.exp(-foreign_rate * time_to_maturity_years)
-        discount_domestic = np.exp(-domestic_rate * time_to_maturity_years)
-
         term1 = discount_foreign * spot_rate * N_d1
         term2 = strike_price * discount_domestic * N_d2
 
@@ -113,17 +236,67 @@ class GarmanKohlhagenPricer:
         )
         theta_daily = theta_annual / 365
 
-        greeks = {
-            "delta": float(delta),
-            "gamma": float(gamma),
-            "vega": float(vega / 100),  # Per 1% change in volatility
-            "theta": float(theta_daily),
-        }
+        greeks = GreeksResult(
+            delta=float(delta),
+            gamma=float(gamma),
+            vega=float(vega / 100),  # Per 1% change in volatility
+            theta=float(theta_daily),
+        )
+
+        return OptionResult(
+            option_price=float(option_price),
+            d1=float(d1),
+            d2=float(d2),
+            greeks=greeks,
+        )
+
+    @staticmethod
+    def calculate_call_option_batch(
+        spot_rate: np.ndarray,
+        strike_price: np.ndarray,
+        time_to_maturity_years: np.ndarray,
+        volatility: np.ndarray,
+        domestic_rate: np.ndarray,
+        foreign_rate: np.ndarray,
+    ) -> Dict:
+        """
+        Vectorized calculate_call_option for arrays of inputs.
+
+        Inputs broadcast against each other and are priced in one pass of
+        NumPy ufuncs, so pass many options at once instead of looping.
+        Times to maturity must be positive (no expired-option handling).
+
+        Args:
+            Same as calculate_call_option, as scalars or arrays
+
+        Returns:
+            Dictionary with option_price, d1, d2 and greeks as arrays
+        """
+        spot_rate = np.asarray(spot_rate, dtype=float)
+        strike_price = np.asarray(strike_price, dtype=float)
+        time_to_maturity_years = np.asarray(time_to_maturity_years, dtype=float)
+        volatility = np.asarray(volatility, dtype=float)
+        domestic_rate = np.asarray(domestic_rate, dtype=float)
+        foreign_rate = np.asarray(foreign_rate, dtype=float)
+
+        d1, d2 = garman_kohlhagen_d1_d2(
+            spot_rate, strike_price, time_to_maturity_years, volatility, domestic_rate, foreign_rate,
+        )
+
+        option_price = garman_kohlhagen(
+            spot_rate, strike_price, time_to_maturity_years,
+            volatility, domestic_rate, foreign_rate, "call", d1=d1, d2=d2,
+        )
+
+        greeks = black_scholes_greeks_batch(
+            d1, d2, spot_rate, strike_price, time_to_maturity_years,
+            volatility, domestic_rate, foreign_rate, "call",
+        )
 
         return {
-            "option_price": float(option_price),
-            "d1": float(d1),
-            "d2": float(d2),
+            "option_price": option_price,
+            "d1": d1,
+            "d2": d2,
             "greeks": greeks,
         }
 
@@ -135,7 +308,7 @@ class GarmanKohlhagenPricer:
         volatility: float,
         domestic_rate: float,
         foreign_rate: float,
-    ) -> Dict:
+    ) -> OptionResult:
         """
         Calculate FX put option price using Garman-Kohlhagen formula.
 
@@ -149,26 +322,29 @@ class GarmanKohlhagenPricer:
             Same as calculate_call_option
 
         Returns:
-            Dictionary with option_price, d1, d2, and greeks
+            OptionResult with option_price, d1, d2, and greeks
         """
         # Handle edge case: expired option
         if time_to_maturity_years <= 0:
             intrinsic_value = max(0, strike_price - spot_rate)
-            return {
-                "option_price": intrinsic_value,
-                "d1": 0,
-                "d2": 0,
-                "greeks": {"delta": -1 if strike_price > spot_rate else 0, "gamma": 0, "vega": 0, "theta": 0},
-            }
+            return OptionResult(
+                option_price=intrinsic_value,
+                d1=0,
+                d2=0,
+                greeks=GreeksResult(delta=-1 if strike_price > spot_rate else 0, gamma=0, vega=0, theta=0),
+            )
 
-        # Calculate d1 and d2 (same as call)
-        sqrt_T = np.sqrt(time_to_maturity_years)
+        # Calculate d1 and d2 (same as call, sharing the discount factors)
+        sqrt_T = math.sqrt(time_to_maturity_years)
         vol_sqrt_T = volatility * sqrt_T
 
-        forward_spot = spot_rate * np.exp(-foreign_rate * time_to_maturity_years)
-        forward_strike = strike_price * np.exp(-domestic_rate * time_to_maturity_years)
+        discount_foreign = math.exp(-foreign_rate * time_to_maturity_years)
+        discount_domestic = math.exp(-domestic_rate * time_to_maturity_years)
 
-        numerator = np.log(forward_spot / forward_strike)
+        forward_spot = spot_rate * discount_foreign
+        forward_strike = strike_price * discount_domestic
+
+        numerator = math.log(forward_spot / forward_strike)
         d1 = (numerator / vol_sqrt_T) + (vol_sqrt_T / 2)
         d2 = d1 - vol_sqrt_T
 
@@ -176,9 +352,6 @@ class GarmanKohlhagenPricer:
         N_neg_d1 = cumulative_normal(-d1)
         N_neg_d2 = cumulative_normal(-d2)
 
-        discount_foreign = np.exp(-foreign_rate * time_to_maturity_years)
-        discount_domestic = np.exp(-domestic_rate * time_to_maturity_years)
-
         term1 = strike_price * discount_domestic * N_neg_d2
         term2 = discount_foreign * spot_rate * N_neg_d1
 
@@ -199,19 +372,19 @@ class GarmanKohlhagenPricer:
         )
         theta_daily = theta_annual / 365
 
-        greeks = {
-            "delta": float(delta),
-            "gamma": float(gamma),
-            "vega": float(vega / 100),
-            "theta": float(theta_daily),
-        }
+        greeks = GreeksResult(
+            delta=float(delta),
+            gamma=float(gamma),
+            vega=float(vega / 100),
+            theta=float(theta_daily),
+        )
 
-        return {
-            "option_price": float(option_price),
-            "d1": float(d1),
-            "d2": float(d2),
-            "greeks": greeks,
-        }
+        return OptionResult(
+            option_price=float(option_price),
+            d1=float(d1),
+            d2=float(d2),
+            greeks=greeks,
+        )
 
     @classmethod
     def price_with_analytics(
@@ -225,6 +398,7 @@ class GarmanKohlhagenPricer:
         notional_amount: float,
         option_type: str = "call",
         protection_level: float = 0.05,
+        dense: bool = True,
     ) -> PricingResponse:
         """
         Calculate option price with full analytics for the UI.
@@ -245,6 +419,8 @@ class GarmanKohlhagenPricer:
             notional_amount: Notional amount in foreign currency
             option_type: "call" or "put"
             protection_level: Protection level (e.g., 0.05 for 5%)
+            dense: If False, skip the 50-point payoff_curve sample and return
+                only payoff_curve_piecewise
 
         Returns:
             PricingResponse with all analytics
@@ -268,67 +444,79 @@ class GarmanKohlhagenPricer:
                 spot_rate, strike_price, time_to_maturity_years, volatility, domestic_rate, foreign_rate
             )
 
-        option_price_per_unit = result["option_price"]
+        option_price_per_unit = result.option_price
         total_option_cost = option_price_per_unit * notional_amount
         cost_percentage = (total_option_cost / (spot_rate * notional_amount)) * 100
 
         # Maximum cost to firm
         max_cost_to_firm = strike_price * notional_amount
 
-        # Scenario analysis at different future spot rates
-        scenarios = []
-        for pct_change in [-0.10, -0.05, 0, 0.05, 0.10]:
-            future_spot = spot_rate * (1 + pct_change)
-
-            # Unhedged cost (for importer, paying at future spot rate)
-            unhedged_cost = future_spot * notional_amount
-
-            # Option payoff
-            if option_type == "call":
-                option_payoff = max(0, future_spot - strike_price) * notional_amount
-            else:
-                option_payoff = max(0, strike_price - future_spot) * notional_amount
-
-            # Net cost = payment at spot + option premium - option payoff
-            net_cost = unhedged_cost + total_option_cost - option_payoff
+        # Scenario and payoff curve spots (cached for repeated spot/strike)
+        scenario_spots, curve_spots, all_spots = _build_grid(float(spot_rate), float(strike_price), dense)
 
-            savings = unhedged_cost - net_cost
+        # Option payoff for scenarios and curve in one pass over a shared grid
+        n_scenarios = len(scenario_spots)
+        if option_type == "call":
+            intrinsic = all_spots - strike_price
+        else:
+            intrinsic = strike_price - all_spots
+        all_option_payoffs = np.maximum(0.0, intrinsic) * notional_amount
 
-            scenarios.append(
-                ScenarioAnalysis(
-                    future_spot_rate=future_spot,
-                    unhedged_cost=unhedged_cost,
-                    option_payoff=option_payoff,
-                    net_cost=net_cost,
-                    savings_vs_unhedged=savings,
-                )
+        # Scenario analysis at different future spot rates
+        scenario_payoffs = all_option_payoffs[:n_scenarios]
+
+        # Unhedged cost (for importer, paying at future spot rate)
+        unhedged_costs = scenario_spots * notional_amount
+
+        # Net cost = payment at spot + option premium - option payoff
+        net_costs = unhedged_costs + total_option_cost - scenario_payoffs
+        savings = unhedged_costs - net_costs
+
+        # Rows are plain dicts; PricingResponse validates them all in one
+        # pass instead of constructing each model from Python
+        scenarios = [
+            {
+                "future_spot_rate": future_spot,
+                "unhedged_cost": unhedged_cost,
+                "option_payoff": option_payoff,
+                "net_cost": net_cost,
+                "savings_vs_unhedged": saving,
+            }
+            for future_spot, unhedged_cost, option_payoff, net_cost, saving in zip(
+                scenario_spots.tolist(),
+                unhedged_costs.tolist(),
+                scenario_payoffs.tolist(),
+                net_costs.tolist(),
+                savings.tolist(),
             )
+        ]
 
         # Generate payoff curve for visualization
-        payoff_curve = []
-        spot_range = np.linspace(spot_rate * 0.85, spot_rate * 1.15, 50)
+        curve_payoffs = all_option_payoffs[n_scenarios:]
 
-        for future_spot in spot_range:
-            # Unhedged P&L (relative to current spot)
-            unhedged_pnl = (future_spot - spot_rate) * notional_amount
+        # Unhedged P&L (relative to current spot)
+        unhedged_pnls = (curve_spots - spot_rate) * notional_amount
 
-            # Option payoff
-            if option_type == "call":
-                option_payoff = max(0, future_spot - strike_price) * notional_amount
-            else:
-                option_payoff = max(0, strike_price - future_spot) * notional_amount
-
-            # Net P&L = unhedged + option payoff - premium
-            net_pnl = unhedged_pnl + option_payoff - total_option_cost
-
-            payoff_curve.append(
-                PayoffCurvePoint(
-                    spot_rate=float(future_spot),
-                    unhedged_pnl=float(unhedged_pnl),
-                    option_payoff=float(option_payoff),
-                    net_pnl=float(net_pnl),
-                )
+        # Net P&L = unhedged + option payoff - premium
+        net_pnls = unhedged_pnls + curve_payoffs - total_option_cost
+
+        curve_points = [
+            {
+                "spot_rate": future_spot,
+                "unhedged_pnl": unhedged_pnl,
+                "option_payoff": option_payoff,
+                "net_pnl": net_pnl,
+            }
+            for future_spot, unhedged_pnl, option_payoff, net_pnl in zip(
+                curve_spots.tolist(),
+                unhedged_pnls.tolist(),
+                curve_payoffs.tolist(),
+                net_pnls.tolist(),
             )
+        ]
+        # Last three curve points are the exact piecewise payoff
+        payoff_curve = curve_points[:-3]
+        payoff_curve_piecewise = curve_points[-3:]
 
         # Break-even rate (where net cost = unhedged cost)
         # For call: breakeven approximately at spot + (premium/notional)
@@ -341,10 +529,16 @@ class GarmanKohlhagenPricer:
             strike_price=strike_price,
             protection_level=protection_level,
             max_cost_to_firm=max_cost_to_firm,
-            d1=result["d1"],
-            d2=result["d2"],
-            greeks=Greeks(**result["greeks"]),
+            d1=result.d1,
+            d2=result.d2,
+            greeks=Greeks(
+                delta=result.greeks.delta,
+                gamma=result.greeks.gamma,
+                vega=result.greeks.vega,
+                theta=result.greeks.theta,
+            ),
             scenarios=scenarios,
             payoff_curve=payoff_curve,
+            payoff_curve_piecewise=payoff_curve_piecewise,
             breakeven_rate=breakeven_rate,
         )
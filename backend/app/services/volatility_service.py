@@ -7,7 +7,6 @@ Uses log returns and annualizes with sqrt(252) trading days convention.
 from datetime import date, datetime, timedelta
 from typing import Optional
 import numpy as np
-import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from app.models.volatility import Volatility
@@ -78,23 +77,18 @@ class VolatilityService:
         end_date = date.today()
         start_date = end_date - timedelta(days=lookback_days + 10)  # Buffer for missing data
 
-        rates = await self.exchange_rate_service.get_historical_rates(base, quote, start_date, end_date, db)
+        _, rates = await self.exchange_rate_service.get_historical_rates_arrays(
+            base, quote, start_date, end_date, db
+        )
 
         if len(rates) < 30:  # Minimum data points
             raise ValueError(f"Insufficient data for volatility calculation: only {len(rates)} days")
 
-        # Convert to pandas DataFrame for easier calculation
-        df = pd.DataFrame(rates)
-        df = df.sort_values("date")
-
-        # Calculate log returns
-        df["log_return"] = np.log(df["rate"] / df["rate"].shift(1))
-
-        # Drop NaN values
-        returns = df["log_return"].dropna()
+        # Calculate log returns (rates are already sorted by date)
+        returns = np.diff(np.log(rates))
 
-        # Calculate daily volatility (standard deviation of log returns)
-        daily_volatility = returns.std()
+        # Calculate daily volatility (sample standard deviation of log returns)
+        daily_volatility = np.std(returns, ddof=1)
 
         # Annualize using sqrt(252) convention (252 trading days per year)
         annualized_volatility = daily_volatility * np.sqrt(252)
@@ -1,8 +1,38 @@
 """
 Date utilities for FX hedging calculations.
 """
+from bisect import bisect_left
 from datetime import date, datetime, timedelta
-from typing import Tuple
+from typing import AbstractSet, Iterable, Optional, Tuple
+import numpy as np
+
+# Upper bounds (inclusive, in days) of the standard maturity buckets
+_BUCKET_EDGES = (1, 7, 30, 90, 180, 365)
+_BUCKET_LABELS = ("O/N", "1W", "1M", "3M", "6M", "1Y")
+_BUCKET_EDGES_ARRAY = np.array(_BUCKET_EDGES)
+_BUCKET_LABELS_ARRAY = np.array(_BUCKET_LABELS, dtype=object)
+
+# Days to the next/previous weekday, indexed by weekday() (Monday = 0)
+_NEXT_BUSINESS_DAY_OFFSET = (1, 1, 1, 1, 3, 2, 1)
+_PREVIOUS_BUSINESS_DAY_OFFSET = (3, 1, 1, 1, 1, 1, 2)
+
+# Day count convention -> days per year
+_CONV_NUM = {"actual/365": 365.0, "actual/360": 360.0}
+
+# Holidays may be any iterable of dates; sets are used as-is for lookups
+HolidayDates = Optional[Iterable[date]]
+
+
+def _as_holiday_set(holidays: HolidayDates) -> AbstractSet[date]:
+    """Return holidays as a set for O(1) membership tests (sets pass through)."""
+    if holidays is None:
+        return frozenset()
+    if isinstance(holidays, (set, frozenset)):
+        return holidays
+    if isinstance(holidays, np.ndarray):
+        # datetime64 and object arrays alike come back as datetime.date
+        return frozenset(holidays.astype("datetime64[D]").tolist())
+    return frozenset(holidays)
 
 
 def calculate_time_to_maturity(invoice_date: date, payment_date: date) -> float:
@@ -45,7 +75,47 @@ def calculate_days_to_maturity(invoice_date: date, payment_date: date) -> int:
     return days_diff
 
 
-def get_trading_days(start_date: date, end_date: date, holidays: list = None) -> int:
+def calculate_days_to_maturity_batch(invoice_dates, payment_dates) -> np.ndarray:
+    """
+    Calculate days between invoice and payment for many contracts at once.
+
+    Vectorized version of calculate_days_to_maturity for pricing a whole
+    portfolio without a per-contract Python loop.
+
+    Args:
+        invoice_dates: Sequence or array of invoice dates
+        payment_dates: Sequence or array of payment dates (same length)
+
+    Returns:
+        Array of day counts (int64)
+    """
+    days_diff = (
+        np.asarray(payment_dates, dtype="datetime64[D]") - np.asarray(invoice_dates, dtype="datetime64[D]")
+    ).astype(np.int64)
+
+    if (days_diff < 0).any():
+        raise ValueError("Payment date must be after invoice date")
+
+    return days_diff
+
+
+def calculate_time_to_maturity_batch(invoice_dates, payment_dates) -> np.ndarray:
+    """
+    Calculate time to maturity in years for many contracts at once.
+
+    Vectorized version of calculate_time_to_maturity (actual/365).
+
+    Args:
+        invoice_dates: Sequence or array of invoice dates
+        payment_dates: Sequence or array of payment dates (same length)
+
+    Returns:
+        Array of times to maturity in years
+    """
+    return calculate_days_to_maturity_batch(invoice_dates, payment_dates) / 365.0
+
+
+def get_trading_days(start_date: date, end_date: date, holidays: HolidayDates = None) -> int:
     """
     Calculate number of trading days between two dates.
 
@@ -54,27 +124,25 @@ def get_trading_days(start_date: date, end_date: date, holidays: list = None) ->
     Args:
         start_date: Start date
         end_date: End date
-        holidays: List of holiday dates to exclude (optional)
+        holidays: Holiday dates to exclude (optional)
 
     Returns:
         Number of trading days
     """
-    if holidays is None:
-        holidays = []
-
-    trading_days = 0
-    current_date = start_date
-
-    while current_date <= end_date:
-        # Check if weekday (Monday = 0, Sunday = 6)
-        if current_date.weekday() < 5:  # Monday-Friday
-            # Check if not a holiday
-            if current_date not in holidays:
-                trading_days += 1
-
-        current_date += timedelta(days=1)
-
-    return trading_days
+    # Day precision, so datetime inputs count the same as their dates
+    start = np.datetime64(start_date, "D")
+    end = np.datetime64(end_date, "D")
+    if end < start:
+        return 0
+
+    # busday_count excludes the end date, so extend the range by one day
+    return int(
+        np.busday_count(
+            start,
+            end + np.timedelta64(1, "D"),
+            holidays=np.fromiter(_as_holiday_set(holidays), dtype="datetime64[D]"),
+        )
+    )
 
 
 def annualize_rate(rate: float, days: int, convention: str = "actual/365") -> float:
@@ -89,12 +157,24 @@ def annualize_rate(rate: float, days: int, convention: str = "actual/365") -> fl
     Returns:
         Annualized rate
     """
-    if convention == "actual/365":
-        return rate * (365 / days)
-    elif convention == "actual/360":
-        return rate * (360 / days)
-    else:
+    num = _CONV_NUM.get(convention)
+    if num is None:
         raise ValueError(f"Unknown convention: {convention}")
+    return rate * (num / days)
+
+
+def annualize_rate_365(rate: float, days: int) -> float:
+    """
+    Annualize a rate using actual/365 (specialized form of annualize_rate).
+
+    Args:
+        rate: Rate for the period (e.g., 0.02 for 2%)
+        days: Number of days in the period
+
+    Returns:
+        Annualized rate
+    """
+    return rate * (365.0 / days)
 
 
 def date_range(start_date: date, end_date: date, step_days: int = 1) -> list:
@@ -109,14 +189,21 @@ def date_range(start_date: date, end_date: date, step_days: int = 1) -> list:
     Returns:
         List of dates
     """
-    dates = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        dates.append(current_date)
-        current_date += timedelta(days=step_days)
-
-    return dates
+    if isinstance(start_date, datetime) or isinstance(end_date, datetime):
+        # Keep datetimes (and their time of day); the fast path below yields dates
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=step_days)
+        return dates
+
+    # Generate the whole series in one stride; tolist() yields datetime.date objects
+    return np.arange(
+        np.datetime64(start_date, "D"),
+        np.datetime64(end_date, "D") + np.timedelta64(1, "D"),
+        np.timedelta64(step_days, "D"),
+    ).tolist()
 
 
 def get_maturity_bucket(days_to_maturity: int) -> str:
@@ -137,81 +224,103 @@ def get_maturity_bucket(days_to_maturity: int) -> str:
     Returns:
         Maturity bucket label
     """
-    if days_to_maturity <= 1:
-        return "O/N"
-    elif days_to_maturity <= 7:
-        return "1W"
-    elif days_to_maturity <= 30:
-        return "1M"
-    elif days_to_maturity <= 90:
-        return "3M"
-    elif days_to_maturity <= 180:
-        return "6M"
-    elif days_to_maturity <= 365:
-        return "1Y"
-    else:
-        years = days_to_maturity / 365
-        return f"{years:.1f}Y"
-
-
-def is_business_day(check_date: date, holidays: list = None) -> bool:
+    i = bisect_left(_BUCKET_EDGES, days_to_maturity)
+    if i < len(_BUCKET_LABELS):
+        return _BUCKET_LABELS[i]
+
+    years = days_to_maturity / 365
+    return f"{years:.1f}Y"
+
+
+def get_maturity_buckets(days_to_maturity) -> np.ndarray:
+    """
+    Categorize many maturities into standard buckets at once.
+
+    Vectorized version of get_maturity_bucket using a binary search over
+    the bucket edges.
+
+    Args:
+        days_to_maturity: Sequence or array of days until maturity
+
+    Returns:
+        Array of maturity bucket labels (object dtype)
+    """
+    days = np.asarray(days_to_maturity)
+    idx = np.searchsorted(_BUCKET_EDGES_ARRAY, days, side="left")
+
+    labels = np.empty(days.shape, dtype=object)
+    within_year = idx < len(_BUCKET_LABELS)
+    labels[within_year] = _BUCKET_LABELS_ARRAY[idx[within_year]]
+
+    # Longer maturities are labelled in years, e.g. "1.5Y"
+    labels[~within_year] = [f"{d / 365:.1f}Y" for d in days[~within_year].tolist()]
+
+    return labels
+
+
+def is_business_day(check_date: date, holidays: HolidayDates = None) -> bool:
     """
     Check if a date is a business day.
 
     Args:
         check_date: Date to check
-        holidays: List of holiday dates (optional)
+        holidays: Holiday dates (optional); pass a set to skip conversion
 
     Returns:
         True if business day, False otherwise
     """
-    if holidays is None:
-        holidays = []
-
     # Check if weekend
     if check_date.weekday() >= 5:  # Saturday or Sunday
         return False
 
     # Check if holiday
-    if check_date in holidays:
+    if check_date in _as_holiday_set(holidays):
         return False
 
     return True
 
 
-def next_business_day(from_date: date, holidays: list = None) -> date:
+def next_business_day(from_date: date, holidays: HolidayDates = None) -> date:
     """
     Get the next business day after the given date.
 
     Args:
         from_date: Starting date
-        holidays: List of holiday dates (optional)
+        holidays: Holiday dates (optional); pass a set to skip conversion
 
     Returns:
         Next business day
     """
+    holiday_set = _as_holiday_set(holidays)
+    if not holiday_set:
+        return from_date + timedelta(days=_NEXT_BUSINESS_DAY_OFFSET[from_date.weekday()])
+
     next_day = from_date + timedelta(days=1)
 
-    while not is_business_day(next_day, holidays):
+    while not is_business_day(next_day, holiday_set):
         next_day += timedelta(days=1)
 
     return next_day
 
 
-def previous_business_day(from_date: date, holidays: list = None) -> date:
+def previous_business_day(from_date: date, holidays: HolidayDates = None) -> date:
     """
     Get the previous business day before the given date.
 
     Args:
         from_date: Starting date
-        holidays: List of holiday dates (optional)
+        holidays: Holiday dates (optional); pass a set to skip conversion
 
     Returns:
         Previous business day
     """
+    holiday_set = _as_holiday_set(holidays)
+    if not holiday_set:
+        return from_date - timedelta(days=_PREVIOUS_BUSINESS_DAY_OFFSET[from_date.weekday()])
+
     prev_day = from_date - timedelta(days=1)
 
-    while not is_business_day(prev_day, holidays):
+    while not is_business_day(prev_day, holiday_set):
         prev_day -= timedelta(days=1)
 
     return prev_day
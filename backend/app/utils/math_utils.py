@@ -1,34 +1,294 @@
 """
 Mathematical utilities for option pricing.
 """
-from scipy.stats import norm
+import math
+from typing import Optional, Tuple, Union
+from scipy.special import ndtr
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; generate_gbm_paths falls back to NumPy
+    njit = None
 
-def cumulative_normal(x: float) -> float:
+# sqrt(2*pi) and its inverse, for the standard normal density
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_INV_SQRT_2PI = 1.0 / _SQRT_2PI
+
+# 1 / sqrt(2), for N(x) = erfc(-x / sqrt(2)) / 2
+_INV_SQRT_2 = 0.7071067811865475
+
+# Below this many paths, the NumPy path beats thread start-up in the JIT kernel
+NUMBA_MIN_SIMULATIONS = 100_000
+
+# Normals drawn per tile in generate_gbm_paths (8192 doubles = 64 KiB, fits L2)
+MC_TILE = 8192
+
+# Below this many options, black_scholes_greeks_batch stays on the ndtr ufunc
+NUMBA_MIN_OPTIONS = 100_000
+
+
+def cumulative_normal(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Cumulative standard normal distribution N(x).
 
+    Accepts scalars or arrays; arrays are evaluated element-wise in a single
+    ufunc call, so batch inputs rather than calling this in a loop. Floats go
+    through math.erfc, which skips the ufunc dispatch of a scalar ndtr call
+    and keeps the same relative accuracy in the lower tail.
+
     Args:
-        x: Input value
+        x: Input value or array of values
 
     Returns:
         Probability that a standard normal random variable is <= x
     """
-    return norm.cdf(x)
+    if isinstance(x, float):
+        return 0.5 * math.erfc(-x * _INV_SQRT_2)
+    return ndtr(x)
 
 
-def probability_density_normal(x: float) -> float:
+def probability_density_normal(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Probability density function of standard normal distribution.
 
+    Accepts scalars or arrays; arrays are evaluated element-wise. Floats go
+    through math.exp to skip the ufunc dispatch.
+
     Args:
-        x: Input value
+        x: Input value or array of values
 
     Returns:
         PDF value at x
     """
-    return norm.pdf(x)
+    if isinstance(x, float):
+        return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+    return np.exp(-0.5 * np.square(x)) * _INV_SQRT_2PI
+
+
+def garman_kohlhagen_d1_d2(
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    rd: Union[float, np.ndarray],
+    rf: Union[float, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The d1 and d2 terms of the Garman-Kohlhagen formula.
+
+    All arguments broadcast. Pass the result to garman_kohlhagen and
+    black_scholes_greeks_batch so both share one evaluation.
+
+    Args:
+        Same as garman_kohlhagen, without option_type
+
+    Returns:
+        Tuple of (d1, d2)
+    """
+    vol_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(np.divide(S, K)) + np.subtract(rd, rf) * T) / vol_sqrt_T + vol_sqrt_T / 2
+    return d1, d1 - vol_sqrt_T
+
+
+def garman_kohlhagen(
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    rd: Union[float, np.ndarray],
+    rf: Union[float, np.ndarray],
+    option_type: str = "call",
+    d1: Optional[np.ndarray] = None,
+    d2: Optional[np.ndarray] = None,
+) -> Union[float, np.ndarray]:
+    """
+    Closed-form Garman-Kohlhagen price of a European FX option.
+
+    Vanilla options have this exact solution, so price them here rather than
+    by simulation; generate_gbm_paths is for payoffs without a closed form.
+    All arguments broadcast, so a whole portfolio can be passed as arrays.
+
+    Args:
+        S: Spot rate(s)
+        K: Strike price(s)
+        T: Time(s) to maturity in years (must be > 0)
+        sigma: Annualized volatility
+        rd: Domestic risk-free rate(s)
+        rf: Foreign risk-free rate(s)
+        option_type: "call" or "put"
+        d1, d2: Terms from garman_kohlhagen_d1_d2, if already computed
+
+    Returns:
+        Option price(s) per unit of foreign currency
+    """
+    if option_type not in ("call", "put"):
+        raise ValueError(f"Invalid option type: {option_type}")
+
+    if d1 is None or d2 is None:
+        d1, d2 = garman_kohlhagen_d1_d2(S, K, T, sigma, rd, rf)
+
+    discount_foreign = np.exp(np.negative(rf) * T)
+    discount_domestic = np.exp(np.negative(rd) * T)
+
+    if option_type == "call":
+        return discount_foreign * S * ndtr(d1) - K * discount_domestic * ndtr(d2)
+    return K * discount_domestic * ndtr(-d2) - discount_foreign * S * ndtr(-d1)
+
+
+def black_scholes_greeks_batch(
+    d1: Union[float, np.ndarray],
+    d2: Union[float, np.ndarray],
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    rd: Union[float, np.ndarray],
+    rf: Union[float, np.ndarray],
+    option_type: str = "call",
+) -> dict:
+    """
+    Garman-Kohlhagen Greeks for many options in one vectorized pass.
+
+    N(d1), N(d2) and n(d1) are evaluated once and shared by every Greek.
+    All arguments broadcast, so a whole portfolio can be passed as arrays.
+    Units match GarmanKohlhagenPricer: vega per 1% vol, theta per day.
+
+    With numba installed and at least NUMBA_MIN_OPTIONS options, all four
+    Greeks are computed in one parallel JIT loop; it evaluates N(x) with
+    math.erfc, so results match the ndtr path whatever the batch size.
+
+    Args:
+        d1: d1 term(s)
+        d2: d2 term(s)
+        S: Spot rate(s)
+        K: Strike price(s)
+        T: Time(s) to maturity in years (must be > 0)
+        sigma: Annualized volatility
+        rd: Domestic risk-free rate(s)
+        rf: Foreign risk-free rate(s)
+        option_type: "call" or "put"
+
+    Returns:
+        Dictionary with delta, gamma, vega and theta arrays
+    """
+    if option_type not in ("call", "put"):
+        raise ValueError(f"Invalid option type: {option_type}")
+
+    if _greeks_numba is not None and np.broadcast(d1, d2, S, K, T, sigma, rd, rf).size >= NUMBA_MIN_OPTIONS:
+        arrays = np.broadcast_arrays(d1, d2, S, K, T, sigma, rd, rf)
+        shape = arrays[0].shape
+        flat = [np.ascontiguousarray(a, dtype=float).ravel() for a in arrays]
+        delta, gamma, vega, theta = _greeks_numba(*flat, option_type == "call")
+        return {
+            "delta": delta.reshape(shape),
+            "gamma": gamma.reshape(shape),
+            "vega": vega.reshape(shape),
+            "theta": theta.reshape(shape),
+        }
+
+    d1 = np.asarray(d1, dtype=float)
+    d2 = np.asarray(d2, dtype=float)
+
+    sqrt_T = np.sqrt(T)
+    discount_foreign = np.exp(np.negative(rf) * T)
+    discount_domestic = np.exp(np.negative(rd) * T)
+    pdf_d1 = probability_density_normal(d1)
+
+    # Shared by both option types
+    gamma = (discount_foreign * pdf_d1) / (S * sigma * sqrt_T)
+    vega = S * discount_foreign * pdf_d1 * sqrt_T
+    theta_decay = -(S * pdf_d1 * sigma * discount_foreign) / (2 * sqrt_T)
+
+    if option_type == "call":
+        N_d1 = ndtr(d1)
+        N_d2 = ndtr(d2)
+        delta = discount_foreign * N_d1
+        theta_annual = (
+            theta_decay
+            + rf * S * N_d1 * discount_foreign
+            - rd * K * discount_domestic * N_d2
+        )
+    else:
+        N_neg_d1 = ndtr(-d1)
+        N_neg_d2 = ndtr(-d2)
+        delta = -discount_foreign * N_neg_d1
+        theta_annual = (
+            theta_decay
+            - rf * S * N_neg_d1 * discount_foreign
+            + rd * K * discount_domestic * N_neg_d2
+        )
+
+    return {
+        "delta": delta,
+        "gamma": gamma,
+        "vega": vega / 100,  # Per 1% change in volatility
+        "theta": theta_annual / 365,
+    }
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gbm_terminal_numba(S0, drift, vol_sqrt_T, Z):
+        """Fused, parallel S0 * exp(drift + vol_sqrt_T * Z) over all paths."""
+        S_T = np.empty(Z.shape[0])
+        for i in prange(Z.shape[0]):
+            S_T[i] = S0 * math.exp(drift + vol_sqrt_T * Z[i])
+        return S_T
+
+    @njit(inline="always")
+    def _ndtr_jit(x):
+        """N(x) = erfc(-x / sqrt(2)) / 2, callable from JIT code."""
+        return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _greeks_numba(d1, d2, S, K, T, sigma, rd, rf, is_call):
+        """Fused, parallel Garman-Kohlhagen Greeks over 1-D option arrays."""
+        n = d1.shape[0]
+        delta = np.empty(n)
+        gamma = np.empty(n)
+        vega = np.empty(n)
+        theta = np.empty(n)
+        for i in prange(n):
+            sqrt_T = math.sqrt(T[i])
+            discount_foreign = math.exp(-rf[i] * T[i])
+            discount_domestic = math.exp(-rd[i] * T[i])
+            pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1[i] * d1[i])
+
+            gamma[i] = (discount_foreign * pdf_d1) / (S[i] * sigma[i] * sqrt_T)
+            vega[i] = S[i] * discount_foreign * pdf_d1 * sqrt_T / 100
+            theta_annual = -(S[i] * pdf_d1 * sigma[i] * discount_foreign) / (2 * sqrt_T)
+            if is_call:
+                N_d1 = _ndtr_jit(d1[i])
+                N_d2 = _ndtr_jit(d2[i])
+                delta[i] = discount_foreign * N_d1
+                theta_annual += rf[i] * S[i] * N_d1 * discount_foreign - rd[i] * K[i] * discount_domestic * N_d2
+            else:
+                N_neg_d1 = _ndtr_jit(-d1[i])
+                N_neg_d2 = _ndtr_jit(-d2[i])
+                delta[i] = -discount_foreign * N_neg_d1
+                theta_annual += rd[i] * K[i] * discount_domestic * N_neg_d2 - rf[i] * S[i] * N_neg_d1 * discount_foreign
+            theta[i] = theta_annual / 365
+        return delta, gamma, vega, theta
+
+    # Compile (or load from the on-disk cache) at import so the first
+    # request doesn't pay the JIT cost
+    _gbm_terminal_numba(1.0, 0.0, 0.0, np.zeros(1))
+    _greeks_numba(*([np.ones(1)] * 8), True)
+else:
+    _gbm_terminal_numba = None
+    _greeks_numba = None
+
+
+def _gbm_terminal_into(
+    S0: float, drift: float, vol_sqrt_T: float, z: np.ndarray, out: np.ndarray
+) -> None:
+    """Write S0 * exp(drift + vol_sqrt_T * z) into out without temporaries."""
+    np.multiply(z, vol_sqrt_T, out=out)
+    out += drift
+    np.exp(out, out=out)
+    out *= S0
 
 
 def generate_gbm_paths(
@@ -38,32 +298,75 @@ def generate_gbm_paths(
     T: float,
     n_simulations: int = 10000,
     seed: int = None,
+    rng: Optional[np.random.Generator] = None,
+    antithetic: bool = True,
 ) -> np.ndarray:
     """
     Generate paths using Geometric Brownian Motion.
 
+    Only needed for payoffs without a closed form (path-dependent or exotic);
+    vanilla European options should be priced with garman_kohlhagen.
+
     S_T = S_0 * exp((mu - sigma^2/2)*T + sigma*sqrt(T)*Z)
 
     where Z ~ N(0,1)
 
+    Draws always come from a NumPy Generator so a given seed reproduces the
+    same paths; with numba installed and n_simulations >= NUMBA_MIN_SIMULATIONS
+    the exp/drift/diffusion step runs in a parallel JIT kernel.
+
     Args:
         S0: Initial spot rate
         mu: Drift rate (typically r_domestic - r_foreign under risk-neutral pricing)
         sigma: Volatility
         T: Time to maturity in years
         n_simulations: Number of Monte Carlo paths
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility (ignored when rng is given)
+        rng: NumPy Generator to draw from; defaults to a fresh PCG64
+            Generator seeded with seed. Never touches global np.random state
+        antithetic: If True, pair each draw Z with -Z (variance reduction);
+            only half as many normals are drawn
 
     Returns:
         Array of simulated terminal spot rates
     """
-    if seed is not None:
-        np.random.seed(seed)
+    if rng is None:
+        rng = np.random.default_rng(seed)
 
-    Z = np.random.standard_normal(n_simulations)
     drift = (mu - 0.5 * sigma**2) * T
-    diffusion = sigma * np.sqrt(T) * Z
+    vol_sqrt_T = sigma * math.sqrt(T)
+
+    # Large runs use the compiled kernel when numba is installed
+    if _gbm_terminal_numba is not None and n_simulations >= NUMBA_MIN_SIMULATIONS:
+        Z = np.empty(n_simulations)
+        if antithetic:
+            # Second half mirrors the first; an odd count gets one extra draw
+            n_half = n_simulations // 2
+            rng.standard_normal(out=Z[:n_half])
+            np.negative(Z[:n_half], out=Z[n_half : 2 * n_half])
+            if n_simulations % 2:
+                Z[-1] = rng.standard_normal()
+        else:
+            rng.standard_normal(out=Z)
+        return _gbm_terminal_numba(S0, drift, vol_sqrt_T, Z)
 
-    S_T = S0 * np.exp(drift + diffusion)
+    # Otherwise draw and transform MC_TILE normals at a time so the draw
+    # buffer and the output tile stay in L2. Draws come out in the same
+    # order as one big draw, so a seed yields the same normals at any tile size
+    S_T = np.empty(n_simulations)
+    n_half = n_simulations // 2
+    n_draws = n_half if antithetic else n_simulations
+    z_buf = np.empty(min(MC_TILE, n_draws))
+    for start in range(0, n_draws, MC_TILE):
+        end = min(start + MC_TILE, n_draws)
+        z = z_buf[: end - start]
+        rng.standard_normal(out=z)
+        _gbm_terminal_into(S0, drift, vol_sqrt_T, z, S_T[start:end])
+        if antithetic:
+            # Mirror path: second half of S_T uses -Z
+            _gbm_terminal_into(S0, drift, -vol_sqrt_T, z, S_T[n_half + start : n_half + end])
+    if antithetic and n_simulations % 2:
+        # An odd count gets one extra, unpaired draw
+        _gbm_terminal_into(S0, drift, vol_sqrt_T, rng.standard_normal(1), S_T[-1:])
 
     return S_T
@@ -0,0 +1,36 @@
+"""
+pytest configuration shared by test_endpoints.py and tests/.
+"""
+import pytest
+from scipy.special import ndtr
+from app.services.pricing_engine import GarmanKohlhagenPricer
+
+# Warm scipy's ndtr and the scalar pricer once at load, before the test
+# modules are collected, so the first test doesn't carry the cold-start cost
+ndtr(0.0)
+GarmanKohlhagenPricer.calculate_call_option(
+    spot_rate=1.0,
+    strike_price=1.0,
+    time_to_maturity_years=0.01,
+    volatility=0.1,
+    domestic_rate=0.01,
+    foreign_rate=0.01,
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--smoke",
+        action="store_true",
+        default=False,
+        help="Run end-to-end smoke tests (marked smoke); skipped by default",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--smoke"):
+        return
+    skip_smoke = pytest.mark.skip(reason="smoke test; pass --smoke to run")
+    for item in items:
+        if "smoke" in item.keywords:
+            item.add_marker(skip_smoke)
@@ -10,26 +10,63 @@ Tests cover:
 - Volatility calculation
 - Database operations
 - Error handling
+
+Tests are independent HTTP round-trips and can run in parallel:
+    pytest test_endpoints.py -n auto --dist loadgroup
+Tests that reset shared demo data are pinned to one worker via
+xdist_group("serial").
 """
+import asyncio
+import logging
+import os
 import pytest
+import pytest_asyncio
 import httpx
 from typing import Dict, Any
-import time
 
 # Base URL for the API
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api"
 
+# Workflow progress; shown with --log-cli-level=DEBUG
+logger = logging.getLogger(__name__)
+
+
+# Tests that generate or reset shared demo data; run them on a single xdist worker
+serial = pytest.mark.xdist_group("serial")
+
 
 @pytest.fixture(scope="session")
 def api_client():
-    """Create a synchronous HTTP client for API testing."""
-    return httpx.Client(base_url=BASE_URL, timeout=30.0)
+    """Create a synchronous HTTP client for API testing (one per worker)."""
+    with httpx.Client(base_url=BASE_URL, timeout=30.0) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def async_api_client():
+    """Create an async HTTP client for fanning out independent requests."""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        yield client
+
+
+@pytest.fixture
+def reset_demo_data(api_client):
+    """Clear demo transactions and hedges after a test that creates them."""
+    yield
+    api_client.post(f"{API_BASE}/demo/reset")
 
 
 @pytest.fixture(scope="session", autouse=True)
 def ensure_server_running(api_client):
-    """Ensure the server is running before tests."""
+    """
+    Ensure the server is running and warm before tests.
+
+    Pays the server's cold start (DB connection, first route resolution)
+    once up front and seeds currencies so every test can rely on them.
+    Demo data is reset at the end of a serial run; xdist workers skip the
+    reset so one finishing worker can't wipe data another is still using.
+    """
     try:
         response = api_client.get("/health")
         assert response.status_code == 200
@@ -37,6 +74,13 @@ def ensure_server_running(api_client):
     except Exception as e:
         pytest.fail(f"Server not running at {BASE_URL}. Please start it with 'uvicorn app.main:app'\nError: {e}")
 
+    api_client.post(f"{API_BASE}/demo/seed-currencies")
+
+    yield
+
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        api_client.post(f"{API_BASE}/demo/reset")
+
 
 # ============================================================================
 # DEMO ENDPOINTS - Currency Seeding
@@ -96,7 +140,8 @@ class TestDemoCurrencySeeding:
 class TestDemoTransactionGeneration:
     """Test demo transaction generation."""
 
-    def test_generate_demo_data_all_scenarios(self, api_client):
+    @serial
+    def test_generate_demo_data_all_scenarios(self, api_client, reset_demo_data):
         """Test generating all demo transactions."""
         response = api_client.post(f"{API_BASE}/demo/generate")
 
@@ -123,7 +168,8 @@ class TestDemoTransactionGeneration:
 
         print(f"Generated {len(transactions)} demo transactions")
 
-    def test_generate_demo_data_limited(self, api_client):
+    @serial
+    def test_generate_demo_data_limited(self, api_client, reset_demo_data):
         """Test generating limited number of transactions."""
         response = api_client.post(f"{API_BASE}/demo/generate?num_transactions=3")
 
@@ -134,6 +180,7 @@ class TestDemoTransactionGeneration:
         assert isinstance(transactions, list)
         assert len(transactions) <= 3
 
+    @serial
     def test_demo_data_reset(self, api_client):
         """Test resetting demo data."""
         # First generate some data
@@ -299,6 +346,7 @@ class TestPricingCalculationManual:
 class TestPricingCalculationAuto:
     """Test automatic pricing calculation with data fetching."""
 
+    @serial
     def test_pricing_calculate_auto_valid(self, api_client):
         """Test auto pricing with valid currency pair."""
         # First ensure currencies are seeded
@@ -377,19 +425,32 @@ class TestPricingCalculationAuto:
 class TestExchangeRateFallback:
     """Test exchange rate fetching and fallback mechanisms."""
 
-    def test_get_current_rate_cached(self, api_client):
-        """Test getting current exchange rate from cache."""
+    @serial
+    @pytest.mark.asyncio
+    async def test_get_current_rate_probes(self, async_api_client):
+        """Test cached, force-refreshed and invalid rate lookups concurrently."""
         # Seed demo rates first
-        api_client.post(f"{API_BASE}/demo/generate")
-
-        # Get rate (should use cache)
-        response = api_client.get(
-            f"{API_BASE}/rates/current",
-            params={"base": "USD", "quote": "MXN"}
+        await async_api_client.post(f"{API_BASE}/demo/generate")
+
+        # The three lookups are independent; overlap their round-trips
+        cached, refreshed, invalid = await asyncio.gather(
+            async_api_client.get(
+                f"{API_BASE}/rates/current",
+                params={"base": "USD", "quote": "MXN"}
+            ),
+            async_api_client.get(
+                f"{API_BASE}/rates/current",
+                params={"base": "USD", "quote": "EUR", "force_refresh": True}
+            ),
+            async_api_client.get(
+                f"{API_BASE}/rates/current",
+                params={"base": "XXX", "quote": "YYY"}
+            ),
         )
 
-        if response.status_code == 200:
-            data = response.json()
+        # Cached rate (should use cache)
+        if cached.status_code == 200:
+            data = cached.json()
             assert "rate" in data
             assert "base_currency" in data
             assert "quote_currency" in data
@@ -398,30 +459,16 @@ class TestExchangeRateFallback:
             assert data["rate"] > 0
             print(f"USD/MXN rate: {data['rate']}")
 
-    def test_get_current_rate_force_refresh(self, api_client):
-        """Test forcing rate refresh from API."""
-        response = api_client.get(
-            f"{API_BASE}/rates/current",
-            params={"base": "USD", "quote": "EUR", "force_refresh": True}
-        )
-
-        # May fail if no API key configured
-        if response.status_code == 200:
-            data = response.json()
+        # Forced refresh may fail if no API key configured
+        if refreshed.status_code == 200:
+            data = refreshed.json()
             assert "rate" in data
             assert data["rate"] > 0
         else:
-            print(f"Force refresh failed (expected if no API key): {response.status_code}")
+            print(f"Force refresh failed (expected if no API key): {refreshed.status_code}")
 
-    def test_get_current_rate_invalid_currency(self, api_client):
-        """Test getting rate for invalid currency pair."""
-        response = api_client.get(
-            f"{API_BASE}/rates/current",
-            params={"base": "XXX", "quote": "YYY"}
-        )
-
-        # Should handle gracefully (may be 500 or 200 with error)
-        assert response.status_code in [200, 404, 422, 500]
+        # Invalid pair should be handled gracefully (may be 500 or 200 with error)
+        assert invalid.status_code in [200, 404, 422, 500]
 
     def test_refresh_rate_endpoint(self, api_client):
         """Test the refresh rate endpoint."""
@@ -468,6 +515,7 @@ class TestExchangeRateFallback:
 class TestVolatilityCalculation:
     """Test volatility calculation endpoints."""
 
+    @serial
     def test_get_volatility_valid_pair(self, api_client):
         """Test getting volatility for valid currency pair."""
         # Seed some data first
@@ -549,7 +597,8 @@ class TestDatabaseOperations:
         currencies = response2.json()
         assert len(currencies) > 0
 
-    def test_transaction_persistence(self, api_client):
+    @serial
+    def test_transaction_persistence(self, api_client, reset_demo_data):
         """Test that transactions persist in database."""
         # Generate demo transactions
         response1 = api_client.post(f"{API_BASE}/demo/generate")
@@ -564,6 +613,7 @@ class TestDatabaseOperations:
             all_transactions = response2.json()
             assert len(all_transactions) > 0
 
+    @serial
     def test_exchange_rate_caching(self, api_client):
         """Test that exchange rates are cached."""
         # Seed demo rates
@@ -575,8 +625,6 @@ class TestDatabaseOperations:
             params={"base": "USD", "quote": "MXN"}
         )
 
-        time.sleep(0.1)  # Small delay
-
         response2 = api_client.get(
             f"{API_BASE}/rates/current",
             params={"base": "USD", "quote": "MXN"}
@@ -585,11 +633,14 @@ class TestDatabaseOperations:
         # Both should succeed if first succeeded
         if response1.status_code == 200:
             assert response2.status_code == 200
+            # Second request must be served from the cache
+            assert response2.headers["X-Cache"] == "HIT"
             rate1 = response1.json()["rate"]
             rate2 = response2.json()["rate"]
             # Rates should be identical (cached)
             assert rate1 == rate2
 
+    @serial
     def test_demo_data_cleanup(self, api_client):
         """Test that demo data can be cleaned up."""
         # Generate demo data
@@ -607,6 +658,14 @@ class TestDatabaseOperations:
 # ERROR HANDLING AND EDGE CASES
 # ============================================================================
 
+# (method, path, raw body, expected status) for the negative-path checks
+ERROR_CASES = [
+    ("GET", f"{API_BASE}/invalid/endpoint", None, 404),
+    ("DELETE", f"{API_BASE}/demo/seed-currencies", None, 405),
+    ("POST", f"{API_BASE}/pricing/calculate", b"{invalid json}", 422),
+]
+
+
 class TestErrorHandling:
     """Test error handling across endpoints."""
 
@@ -625,72 +684,80 @@ class TestErrorHandling:
         assert "message" in data
         assert "version" in data
 
-    def test_invalid_endpoint(self, api_client):
-        """Test accessing non-existent endpoint."""
-        response = api_client.get(f"{API_BASE}/invalid/endpoint")
-        assert response.status_code == 404
-
-    def test_invalid_method(self, api_client):
-        """Test using wrong HTTP method."""
-        response = api_client.delete(f"{API_BASE}/demo/seed-currencies")
-        assert response.status_code == 405
-
-    def test_malformed_json(self, api_client):
-        """Test sending malformed JSON."""
-        response = api_client.post(
-            f"{API_BASE}/pricing/calculate",
-            content=b"{invalid json}",
-            headers={"Content-Type": "application/json"}
+    @pytest.mark.parametrize(
+        "method,path,body,expected",
+        ERROR_CASES,
+        ids=["invalid_endpoint", "invalid_method", "malformed_json"],
+    )
+    def test_error_responses(self, api_client, method, path, body, expected):
+        """Test non-existent endpoint, wrong HTTP method and malformed JSON."""
+        response = api_client.request(
+            method,
+            path,
+            content=body,
+            headers={"Content-Type": "application/json"} if body is not None else None,
         )
-        assert response.status_code == 422
+        assert response.status_code == expected
 
 
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
 
+@pytest.mark.smoke
 class TestIntegrationWorkflow:
     """Test complete workflows end-to-end."""
 
-    def test_complete_demo_workflow(self, api_client):
+    @serial
+    @pytest.mark.asyncio
+    async def test_complete_demo_workflow(self, async_api_client):
         """Test complete demo workflow: seed, generate, price."""
-        # Step 1: Seed currencies
-        response1 = api_client.post(f"{API_BASE}/demo/seed-currencies")
+        # Step 1: Seed currencies (first, so generate's own seeding finds
+        # them in place rather than racing to insert the same rows)
+        response1 = await async_api_client.post(f"{API_BASE}/demo/seed-currencies")
         assert response1.status_code == 200
-        print("\n1. Currencies seeded")
+        logger.debug("1. Currencies seeded")
+
+        # Steps 2-3 are independent (pricing takes explicit inputs), so
+        # overlap generating transactions with the pricing request
+        generate_task = asyncio.create_task(
+            # Step 2: Generate demo transactions
+            async_api_client.post(f"{API_BASE}/demo/generate?num_transactions=3")
+        )
+        price_task = asyncio.create_task(
+            # Step 3: Calculate pricing for a demo scenario
+            async_api_client.post(
+                f"{API_BASE}/pricing/calculate",
+                json={
+                    "spot_rate": 19.0,
+                    "strike_price": 19.95,
+                    "time_to_maturity_years": 0.25,
+                    "volatility": 0.20,
+                    "domestic_rate": 0.04,
+                    "foreign_rate": 0.07,
+                    "notional_amount": 1000000,
+                    "option_type": "call",
+                    "protection_level": 0.05
+                }
+            )
+        )
+        response2, response3 = await asyncio.gather(generate_task, price_task)
 
-        # Step 2: Generate demo transactions
-        response2 = api_client.post(f"{API_BASE}/demo/generate?num_transactions=3")
         assert response2.status_code == 200
         transactions = response2.json()
         assert len(transactions) > 0
-        print(f"2. Generated {len(transactions)} demo transactions")
-
-        # Step 3: Calculate pricing for a demo scenario
-        response3 = api_client.post(
-            f"{API_BASE}/pricing/calculate",
-            json={
-                "spot_rate": 19.0,
-                "strike_price": 19.95,
-                "time_to_maturity_years": 0.25,
-                "volatility": 0.20,
-                "domestic_rate": 0.04,
-                "foreign_rate": 0.07,
-                "notional_amount": 1000000,
-                "option_type": "call",
-                "protection_level": 0.05
-            }
-        )
+        logger.debug("2. Generated %d demo transactions", len(transactions))
+
         assert response3.status_code == 200
         pricing = response3.json()
-        print(f"3. Calculated option price: {pricing['option_price']:.4f}")
-        print(f"   Total cost: {pricing['total_cost']:.2f}")
-        print(f"   Cost percentage: {pricing['cost_percentage']:.2f}%")
+        logger.debug("3. Calculated option price: %.4f", pricing["option_price"])
+        logger.debug("   Total cost: %.2f", pricing["total_cost"])
+        logger.debug("   Cost percentage: %.2f%%", pricing["cost_percentage"])
 
-        # Step 4: Clean up
-        response4 = api_client.post(f"{API_BASE}/demo/reset")
+        # Step 4: Clean up (after everything above has finished)
+        response4 = await async_api_client.post(f"{API_BASE}/demo/reset")
         assert response4.status_code == 200
-        print("4. Demo data cleaned up")
+        logger.debug("4. Demo data cleaned up")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the unit tests.
+"""
+import pytest
+from app.services.pricing_engine import GarmanKohlhagenPricer
+
+
+@pytest.fixture(scope="session")
+def pricer():
+    """
+    One GarmanKohlhagenPricer for the whole session.
+
+    Under pytest-xdist (`pytest tests/ -n auto`) each worker process gets its
+    own session and so its own pricer; it holds no state, so the pure pricing
+    tests need no coordination between workers.
+    """
+    return GarmanKohlhagenPricer()
+
+
+@pytest.fixture(scope="session")
+def reference_call(pricer):
+    """Call priced at the requirements reference case (S=19, K=19.95, T=0.25, vol=20%)."""
+    return pricer.calculate_call_option(
+        spot_rate=19.0,
+        strike_price=19.95,
+        time_to_maturity_years=0.25,
+        volatility=0.20,
+        domestic_rate=0.04,
+        foreign_rate=0.07,
+    )
@@ -0,0 +1,219 @@
+"""
+Unit tests for the date utilities.
+"""
+from datetime import date, datetime, timedelta
+import numpy as np
+import pytest
+from app.utils.date_utils import (
+    annualize_rate,
+    annualize_rate_365,
+    calculate_days_to_maturity,
+    calculate_time_to_maturity,
+    calculate_days_to_maturity_batch,
+    calculate_time_to_maturity_batch,
+    date_range,
+    get_trading_days,
+    get_maturity_bucket,
+    get_maturity_buckets,
+    is_business_day,
+    next_business_day,
+    previous_business_day,
+)
+
+# Friday 2024-03-29 and Monday 2024-04-01 as holidays around a weekend
+HOLIDAYS = [date(2024, 3, 29), date(2024, 4, 1)]
+
+
+def _trading_days_loop(start_date, end_date, holidays=()):
+    """Day-by-day count, as get_trading_days was originally written."""
+    trading_days = 0
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5 and current_date not in holidays:
+            trading_days += 1
+        current_date += timedelta(days=1)
+    return trading_days
+
+
+def _step_to_business_day(from_date, step, holidays=()):
+    """Walk one day at a time, as next/previous_business_day were originally written."""
+    day = from_date + timedelta(days=step)
+    while day.weekday() >= 5 or day in holidays:
+        day += timedelta(days=step)
+    return day
+
+
+def _date_range_loop(start_date, end_date, step_days=1):
+    """Stepwise date list, as date_range was originally written."""
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=step_days)
+    return dates
+
+
+class TestMaturityBatch:
+    """Test suite for the vectorized maturity helpers."""
+
+    def test_batch_matches_scalar(self):
+        """Batch results should match the scalar functions element-wise."""
+        invoice_dates = [date(2024, 1, 1), date(2024, 2, 15), date(2024, 3, 31)]
+        payment_dates = [date(2024, 3, 31), date(2024, 2, 15), date(2025, 3, 31)]
+
+        days = calculate_days_to_maturity_batch(invoice_dates, payment_dates)
+        years = calculate_time_to_maturity_batch(invoice_dates, payment_dates)
+
+        for i, (inv, pay) in enumerate(zip(invoice_dates, payment_dates)):
+            assert days[i] == calculate_days_to_maturity(inv, pay)
+            assert years[i] == calculate_time_to_maturity(inv, pay)
+
+        assert days.dtype == np.int64
+
+    def test_batch_rejects_negative_maturity(self):
+        """Any payment before its invoice should raise."""
+        with pytest.raises(ValueError):
+            calculate_time_to_maturity_batch(
+                [date(2024, 1, 1), date(2024, 6, 1)],
+                [date(2024, 3, 1), date(2024, 5, 1)],
+            )
+
+
+class TestMaturityBuckets:
+    """Test suite for maturity bucketing."""
+
+    def test_bucket_edges(self):
+        """Edges are inclusive upper bounds of each bucket."""
+        assert get_maturity_bucket(1) == "O/N"
+        assert get_maturity_bucket(2) == "1W"
+        assert get_maturity_bucket(30) == "1M"
+        assert get_maturity_bucket(90) == "3M"
+        assert get_maturity_bucket(365) == "1Y"
+        assert get_maturity_bucket(548) == "1.5Y"
+
+    def test_batch_matches_scalar(self):
+        """Vectorized bucketing should match the scalar function."""
+        days = np.arange(-5, 1000)
+
+        labels = get_maturity_buckets(days)
+
+        assert labels.tolist() == [get_maturity_bucket(int(d)) for d in days]
+
+
+class TestAnnualizeRate:
+    """Test suite for rate annualization."""
+
+    def test_conventions(self):
+        """Each convention scales by its days-per-year."""
+        assert annualize_rate(0.01, 90) == pytest.approx(0.01 * 365 / 90)
+        assert annualize_rate(0.01, 90, "actual/360") == pytest.approx(0.01 * 360 / 90)
+        assert annualize_rate_365(0.01, 90) == annualize_rate(0.01, 90)
+
+    def test_unknown_convention(self):
+        """Unsupported conventions should raise."""
+        with pytest.raises(ValueError):
+            annualize_rate(0.01, 90, "30/360")
+
+
+class TestHolidayInputs:
+    """Test suite for the accepted holiday container types."""
+
+    @pytest.mark.parametrize(
+        "holidays",
+        [
+            HOLIDAYS,
+            set(HOLIDAYS),
+            np.array(HOLIDAYS, dtype="datetime64[D]"),
+            np.array(HOLIDAYS, dtype=object),
+        ],
+        ids=["list", "set", "datetime64_array", "object_array"],
+    )
+    def test_containers_agree(self, holidays):
+        """Lists, sets and arrays of holidays should give the same answers."""
+        assert not is_business_day(date(2024, 3, 29), holidays)
+        assert next_business_day(date(2024, 3, 28), holidays) == date(2024, 4, 2)
+        assert previous_business_day(date(2024, 4, 2), holidays) == date(2024, 3, 28)
+
+    def test_empty_array(self):
+        """An empty holiday array behaves like no holidays."""
+        empty = np.array([], dtype="datetime64[D]")
+
+        assert next_business_day(date(2024, 3, 28), empty) == date(2024, 3, 29)
+        assert previous_business_day(date(2024, 4, 2), empty) == date(2024, 4, 1)
+
+
+class TestTradingDays:
+    """Test suite for the trading-day count."""
+
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            (date(2024, 3, 25), date(2024, 3, 29)),  # Monday to Friday, both inclusive
+            (date(2024, 3, 25), date(2024, 3, 25)),  # Single weekday
+            (date(2024, 3, 23), date(2024, 4, 7)),  # Starts and ends on a weekend
+            (date(2024, 3, 30), date(2024, 3, 31)),  # Weekend only
+            (date(2024, 1, 1), date(2024, 12, 31)),
+            (date(2024, 4, 5), date(2024, 3, 25)),  # start > end
+        ],
+    )
+    @pytest.mark.parametrize(
+        "holidays",
+        [None, HOLIDAYS + [date(2024, 3, 30)]],  # includes a Saturday holiday
+        ids=["no_holidays", "holidays"],
+    )
+    def test_matches_loop(self, start, end, holidays):
+        """The busday_count path should match the day-by-day count."""
+        assert get_trading_days(start, end, holidays) == _trading_days_loop(start, end, holidays or ())
+
+    def test_datetime_inputs(self):
+        """Datetimes count the same as their dates."""
+        assert get_trading_days(datetime(2024, 3, 25), datetime(2024, 4, 2)) == 7
+
+    def test_holiday_array(self):
+        """An ndarray of holidays is accepted."""
+        holidays = np.array(HOLIDAYS, dtype="datetime64[D]")
+
+        assert get_trading_days(date(2024, 3, 25), date(2024, 4, 5), holidays) == 8
+
+
+class TestDateRange:
+    """Test suite for date_range."""
+
+    @pytest.mark.parametrize(
+        "start,end,step",
+        [
+            (date(2024, 1, 1), date(2024, 1, 1), 1),
+            (date(2024, 1, 1), date(2024, 3, 31), 1),
+            (date(2024, 1, 1), date(2024, 3, 31), 7),  # end not on a step
+            (date(2024, 2, 1), date(2024, 1, 1), 1),  # start > end
+        ],
+    )
+    def test_matches_loop(self, start, end, step):
+        """The arange path should match the stepwise loop."""
+        result = date_range(start, end, step)
+
+        assert result == _date_range_loop(start, end, step)
+        assert all(type(d) is date for d in result)
+
+    def test_keeps_datetimes(self):
+        """Datetime inputs come back as datetimes with their time of day."""
+        start, end = datetime(2024, 1, 1, 9, 30), datetime(2024, 1, 10, 9, 0)
+
+        result = date_range(start, end, 2)
+
+        assert result == _date_range_loop(start, end, 2)
+        assert all(type(d) is datetime for d in result)
+
+
+class TestBusinessDayOffsets:
+    """Test suite for the weekday offset tables in next/previous_business_day."""
+
+    # Monday 2024-03-25 through Sunday 2024-03-31, one per weekday
+    @pytest.mark.parametrize("from_date", [date(2024, 3, 25) + timedelta(days=i) for i in range(7)])
+    @pytest.mark.parametrize("holidays", [None, HOLIDAYS], ids=["no_holidays", "holidays"])
+    def test_matches_loop(self, from_date, holidays):
+        """Both directions should match the day-by-day walk for every weekday."""
+        walk_holidays = holidays or ()
+
+        assert next_business_day(from_date, holidays) == _step_to_business_day(from_date, 1, walk_holidays)
+        assert previous_business_day(from_date, holidays) == _step_to_business_day(from_date, -1, walk_holidays)
@@ -0,0 +1,178 @@
+"""
+Unit tests for the math utilities used by the pricing engine.
+"""
+import numpy as np
+import pytest
+from scipy.special import ndtr
+from app.utils import math_utils
+from app.utils.math_utils import (
+    black_scholes_greeks_batch,
+    cumulative_normal,
+    garman_kohlhagen,
+    garman_kohlhagen_d1_d2,
+    generate_gbm_paths,
+)
+
+
+class TestGenerateGbmPaths:
+    """Test suite for Monte Carlo path generation."""
+
+    def test_seed_is_reproducible(self):
+        """The same seed should produce the same terminal spots."""
+        paths1 = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=1000, seed=42)
+        paths2 = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=1000, seed=42)
+
+        assert paths1.shape == (1000,)
+        np.testing.assert_array_equal(paths1, paths2)
+
+    def test_injected_rng_matches_seed(self):
+        """An injected Generator should draw the same paths as the equivalent seed."""
+        from_seed = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=1000, seed=42)
+        from_rng = generate_gbm_paths(
+            19.0, 0.03, 0.20, 0.25, n_simulations=1000, rng=np.random.default_rng(42)
+        )
+
+        np.testing.assert_array_equal(from_seed, from_rng)
+
+    def test_antithetic_pairs(self):
+        """Antithetic paths should mirror each other around the drift."""
+        S0, mu, sigma, T = 19.0, 0.03, 0.20, 0.25
+        paths = generate_gbm_paths(S0, mu, sigma, T, n_simulations=1001, seed=1)
+
+        assert paths.shape == (1001,)
+
+        # S_T(Z) * S_T(-Z) = (S0 * exp(drift))^2 for every pair
+        drift = (mu - 0.5 * sigma**2) * T
+        np.testing.assert_allclose(paths[:500] * paths[500:1000], (S0 * np.exp(drift)) ** 2)
+
+    def test_tile_size_does_not_change_paths(self, monkeypatch):
+        """Tiling the draws should reproduce the same paths for a seed."""
+        expected = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=5001, seed=11)
+
+        monkeypatch.setattr(math_utils, "MC_TILE", 64)
+        tiled = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=5001, seed=11)
+
+        np.testing.assert_allclose(tiled, expected, rtol=1e-14)
+
+    def test_terminal_mean_matches_forward(self):
+        """Under GBM, E[S_T] = S0 * exp(mu * T)."""
+        paths = generate_gbm_paths(19.0, 0.03, 0.20, 0.25, n_simulations=200_000, seed=7)
+
+        expected_mean = 19.0 * np.exp(0.03 * 0.25)
+        assert abs(paths.mean() - expected_mean) / expected_mean < 0.002
+
+    def test_numba_kernel_matches_numpy(self):
+        """The JIT kernel should agree with the NumPy expression."""
+        if math_utils._gbm_terminal_numba is None:
+            pytest.skip("numba not installed")
+
+        Z = np.random.default_rng(0).standard_normal(10_000)
+        drift = (0.03 - 0.5 * 0.20**2) * 0.25
+        vol_sqrt_T = 0.20 * np.sqrt(0.25)
+
+        expected = 19.0 * np.exp(drift + vol_sqrt_T * Z)
+        np.testing.assert_allclose(math_utils._gbm_terminal_numba(19.0, drift, vol_sqrt_T, Z), expected, rtol=1e-12)
+
+
+class TestCumulativeNormal:
+    """Test suite for the normal CDF."""
+
+    def test_float_path_matches_ndtr(self):
+        """The erfc path for floats should match ndtr across both tails, arrays use ndtr."""
+        xs = np.linspace(-37.0, 8.0, 1001)
+
+        scalars = [cumulative_normal(float(x)) for x in xs]
+
+        np.testing.assert_allclose(scalars, ndtr(xs), rtol=1e-12)
+        np.testing.assert_array_equal(cumulative_normal(xs), ndtr(xs))
+
+
+class TestGarmanKohlhagen:
+    """Test suite for the closed-form pricer."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_pricer(self, pricer, option_type):
+        """Vectorized prices should match the pricer option by option."""
+        price = pricer.calculate_call_option if option_type == "call" else pricer.calculate_put_option
+        strikes = np.array([18.0, 19.0, 19.95, 21.0])
+
+        prices = garman_kohlhagen(19.0, strikes, 0.25, 0.20, 0.04, 0.07, option_type)
+
+        expected = [price(19.0, k, 0.25, 0.20, 0.04, 0.07).option_price for k in strikes]
+        np.testing.assert_allclose(prices, expected, rtol=1e-12)
+
+    def test_d1_d2_match_pricer(self, reference_call):
+        """The shared d1/d2 helper should match the scalar pricer."""
+        d1, d2 = garman_kohlhagen_d1_d2(19.0, 19.95, 0.25, 0.20, 0.04, 0.07)
+
+        assert d1 == pytest.approx(reference_call.d1, rel=1e-12)
+        assert d2 == pytest.approx(reference_call.d2, rel=1e-12)
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_precomputed_d1_d2(self, option_type):
+        """Passing d1/d2 in should not change the price."""
+        strikes = np.array([18.0, 19.0, 19.95, 21.0])
+        d1, d2 = garman_kohlhagen_d1_d2(19.0, strikes, 0.25, 0.20, 0.04, 0.07)
+
+        np.testing.assert_array_equal(
+            garman_kohlhagen(19.0, strikes, 0.25, 0.20, 0.04, 0.07, option_type, d1=d1, d2=d2),
+            garman_kohlhagen(19.0, strikes, 0.25, 0.20, 0.04, 0.07, option_type),
+        )
+
+    def test_matches_monte_carlo(self):
+        """The closed form should agree with a discounted GBM simulation."""
+        S0, K, T, sigma, rd, rf = 19.0, 19.95, 0.25, 0.20, 0.04, 0.07
+        paths = generate_gbm_paths(S0, rd - rf, sigma, T, n_simulations=400_000, seed=3)
+
+        mc_price = np.exp(-rd * T) * np.maximum(paths - K, 0.0).mean()
+
+        assert mc_price == pytest.approx(garman_kohlhagen(S0, K, T, sigma, rd, rf), rel=0.02)
+
+
+class TestBlackScholesGreeksBatch:
+    """Test suite for the vectorized Greeks."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_pricer(self, pricer, option_type):
+        """Batch Greeks should match the pricer option by option."""
+        price = pricer.calculate_call_option if option_type == "call" else pricer.calculate_put_option
+        strikes = np.array([18.0, 19.0, 19.95, 21.0])
+        maturities = np.array([0.1, 0.25, 0.5, 1.0])
+
+        results = [price(19.0, k, t, 0.20, 0.04, 0.07) for k, t in zip(strikes, maturities)]
+        d1 = np.array([r.d1 for r in results])
+        d2 = np.array([r.d2 for r in results])
+
+        greeks = black_scholes_greeks_batch(
+            d1, d2, 19.0, strikes, maturities, 0.20, 0.04, 0.07, option_type
+        )
+
+        for name in ("delta", "gamma", "vega", "theta"):
+            expected = [getattr(r.greeks, name) for r in results]
+            np.testing.assert_allclose(greeks[name], expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_numba_kernel_matches_ufunc(self, option_type):
+        """The JIT kernel (erfc-based N(x)) should agree with the ndtr path."""
+        if math_utils._greeks_numba is None:
+            pytest.skip("numba not installed")
+
+        rng = np.random.default_rng(0)
+        strikes = rng.uniform(15.0, 23.0, 1000)
+        maturities = rng.uniform(0.05, 2.0, 1000)
+        vol_sqrt_T = 0.20 * np.sqrt(maturities)
+        d1 = (np.log(19.0 / strikes) + (0.04 - 0.07) * maturities) / vol_sqrt_T + vol_sqrt_T / 2
+        d2 = d1 - vol_sqrt_T
+
+        expected = black_scholes_greeks_batch(
+            d1, d2, 19.0, strikes, maturities, 0.20, 0.04, 0.07, option_type
+        )
+        flat = [np.ascontiguousarray(a, dtype=float) for a in np.broadcast_arrays(
+            d1, d2, 19.0, strikes, maturities, 0.20, 0.04, 0.07
+        )]
+        delta, gamma, vega, theta = math_utils._greeks_numba(*flat, option_type == "call")
+
+        np.testing.assert_allclose(delta, expected["delta"], rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(gamma, expected["gamma"], rtol=1e-12)
+        np.testing.assert_allclose(vega, expected["vega"], rtol=1e-12)
+        np.testing.assert_allclose(theta, expected["theta"], rtol=1e-12, atol=1e-15)
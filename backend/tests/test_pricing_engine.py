@@ -4,14 +4,50 @@ Unit tests for the Garman-Kohlhagen pricing engine.
 CRITICAL: These tests verify the mathematical accuracy of our pricing model.
 The test case from the requirements must pass exactly.
 """
+import math
+import numpy as np
 import pytest
-from app.services.pricing_engine import GarmanKohlhagenPricer
+from app.services.pricing_engine import SCENARIO_SHOCKS, GreeksResult, OptionResult
+
+# Reference case (S=19, K=19.95, T=0.25, vol=20%, r_d=4%, r_f=7%) evaluated
+# with mpmath at 40 significant digits, rounded to 17
+REFERENCE_EXPECTED = {
+    "d1": -0.51290164169432003,
+    "d2": -0.61290164169432003,
+    "option_price": 0.34366269361721403,
+    "delta": 0.29873616758080819,
+    "gamma": 0.18089718163205664,
+    "vega": 0.032651941284586224,
+    "theta": -0.0030741137756649307,
+}
+
+# (spot, strike, T, vol, r_d, r_f) per row: reference case, ATM, deep ITM, far OTM
+BATCH = np.array([
+    (19.0, 19.95, 0.25, 0.20, 0.04, 0.07),
+    (20.0, 20.0, 0.5, 0.15, 0.05, 0.05),
+    (25.0, 20.0, 0.25, 0.20, 0.04, 0.07),
+    (15.0, 20.0, 0.25, 0.20, 0.04, 0.07),
+])
+
+# (row, (price low, price high), (delta low, delta high)), exclusive bounds
+BATCH_BOUNDS = [
+    (0, (0.333, 0.353), (0.0, 1.0)),  # ~0.343 per the requirements
+    (1, (0.0, math.inf), (0.4, 0.6)),  # ATM with equal rates: delta ~0.5
+    (2, (4.0, math.inf), (0.8, 1.0)),  # Close to intrinsic, delta near 1
+    (3, (0.0, 0.5), (0.0, 0.2)),  # Low value, delta near 0
+]
+
+
+@pytest.fixture(scope="module")
+def batch_result(pricer):
+    """All BATCH rows priced in one vectorized call."""
+    return pricer.calculate_call_option_batch(*BATCH.T)
 
 
 class TestGarmanKohlhagenPricer:
     """Test suite for the Garman-Kohlhagen option pricing engine."""
 
-    def test_exact_formula_reference_case(self):
+    def test_exact_formula_reference_case(self, reference_call):
         """
         Test against the exact reference case from the requirements.
 
@@ -28,97 +64,76 @@ class TestGarmanKohlhagenPricer:
         - For $1M notional: ~343,000 MXN
         - Cost as % of notional: ~1.8%
         """
-        pricer = GarmanKohlhagenPricer()
+        result = reference_call
 
-        result = pricer.calculate_call_option(
-            spot_rate=19.0,
-            strike_price=19.95,
-            time_to_maturity_years=0.25,
-            volatility=0.20,
-            domestic_rate=0.04,
-            foreign_rate=0.07,
-        )
-
-        option_price = result["option_price"]
+        option_price = result.option_price
 
         # Verify price is approximately 0.343 (within 1% tolerance)
         assert abs(option_price - 0.343) < 0.01, f"Expected ~0.343, got {option_price}"
 
-        # Verify d1 and d2 are calculated
-        assert "d1" in result
-        assert "d2" in result
+        # Verify the result and its Greeks are typed records
+        assert isinstance(result, OptionResult)
+        assert isinstance(result.greeks, GreeksResult)
 
-        # Verify Greeks are present
-        assert "greeks" in result
-        assert "delta" in result["greeks"]
-        assert "gamma" in result["greeks"]
-        assert "vega" in result["greeks"]
-        assert "theta" in result["greeks"]
+        # Match the high-precision reference values tightly
+        for name in ("d1", "d2", "option_price"):
+            assert math.isclose(getattr(result, name), REFERENCE_EXPECTED[name], abs_tol=1e-10), name
+        for name in ("delta", "gamma", "vega", "theta"):
+            assert math.isclose(getattr(result.greeks, name), REFERENCE_EXPECTED[name], abs_tol=1e-10), name
 
         # Delta should be positive and < 1 for call option
-        assert 0 < result["greeks"]["delta"] < 1
-
-    def test_call_option_at_the_money(self):
-        """Test call option when spot equals strike (at-the-money)."""
-        pricer = GarmanKohlhagenPricer()
-
-        result = pricer.calculate_call_option(
-            spot_rate=20.0,
-            strike_price=20.0,
-            time_to_maturity_years=0.5,
-            volatility=0.15,
-            domestic_rate=0.05,
-            foreign_rate=0.05,
-        )
-
-        # ATM option should have positive value
-        assert result["option_price"] > 0
-
-        # Delta should be around 0.5 for ATM call (with equal rates)
-        assert 0.4 < result["greeks"]["delta"] < 0.6
-
-    def test_call_option_deep_in_the_money(self):
-        """Test call option deep in the money."""
-        pricer = GarmanKohlhagenPricer()
-
-        result = pricer.calculate_call_option(
-            spot_rate=25.0,
-            strike_price=20.0,  # Spot well above strike
-            time_to_maturity_years=0.25,
-            volatility=0.20,
-            domestic_rate=0.04,
-            foreign_rate=0.07,
-        )
-
-        # Deep ITM option should have high value
-        assert result["option_price"] > 4.0  # Should be close to intrinsic value
-
-        # Delta should be close to 1
-        assert result["greeks"]["delta"] > 0.8
-
-    def test_call_option_far_out_of_the_money(self):
-        """Test call option far out of the money."""
-        pricer = GarmanKohlhagenPricer()
-
-        result = pricer.calculate_call_option(
-            spot_rate=15.0,
-            strike_price=20.0,  # Spot well below strike
-            time_to_maturity_years=0.25,
-            volatility=0.20,
-            domestic_rate=0.04,
-            foreign_rate=0.07,
-        )
-
-        # Far OTM option should have low value
-        assert result["option_price"] < 0.5
-
-        # Delta should be close to 0
-        assert result["greeks"]["delta"] < 0.2
-
-    def test_put_option_basic(self):
+        assert 0 < result.greeks.delta < 1
+
+    @pytest.mark.parametrize(
+        "idx,price_range,delta_range",
+        BATCH_BOUNDS,
+        ids=["reference", "at_the_money", "deep_in_the_money", "far_out_of_the_money"],
+    )
+    def test_call_option_batch_rows(self, batch_result, idx, price_range, delta_range):
+        """Test reference, ATM, deep ITM and far OTM calls from one batch pricing."""
+        price = batch_result["option_price"][idx]
+        delta = batch_result["greeks"]["delta"][idx]
+
+        assert price_range[0] < price < price_range[1]
+        assert delta_range[0] < delta < delta_range[1]
+
+    def test_call_option_batch_matches_scalar(self, pricer):
+        """Batch pricing should match calculate_call_option element-wise."""
+        spots = np.array([15.0, 19.0, 20.0, 25.0])
+        maturities = np.array([0.08, 0.25, 0.5, 1.0])
+
+        batch = pricer.calculate_call_option_batch(spots, 19.95, maturities, 0.20, 0.04, 0.07)
+
+        for i, (spot, maturity) in enumerate(zip(spots, maturities)):
+            scalar = pricer.calculate_call_option(spot, 19.95, maturity, 0.20, 0.04, 0.07)
+            assert batch["option_price"][i] == pytest.approx(scalar.option_price, rel=1e-12)
+            assert batch["d1"][i] == pytest.approx(scalar.d1, rel=1e-12)
+            for name in ("delta", "gamma", "vega", "theta"):
+                assert batch["greeks"][name][i] == pytest.approx(getattr(scalar.greeks, name), rel=1e-12)
+
+    def test_call_option_batch_accepts_lists(self, pricer, batch_result):
+        """Plain lists for every input should price like arrays."""
+        from_lists = pricer.calculate_call_option_batch(*BATCH.T.tolist())
+
+        np.testing.assert_array_equal(from_lists["option_price"], batch_result["option_price"])
+
+    def test_numba_kernel_matches_numpy(self, pricer, monkeypatch):
+        """The compiled call kernel should agree with the NumPy implementation."""
+        if pricer._kernel_njit is None:
+            pytest.skip("numba not installed")
+
+        args = (19.0, 19.95, 0.25, 0.20, 0.04, 0.07)
+        compiled = pricer.calculate_call_option(*args)
+        monkeypatch.setattr(type(pricer), "_kernel_njit", None)
+        expected = pricer.calculate_call_option(*args)
+
+        assert compiled.option_price == pytest.approx(expected.option_price, rel=1e-12)
+        assert compiled.d1 == pytest.approx(expected.d1, rel=1e-12)
+        for name in ("delta", "gamma", "vega", "theta"):
+            assert getattr(compiled.greeks, name) == pytest.approx(getattr(expected.greeks, name), rel=1e-12)
+
+    def test_put_option_basic(self, pricer):
         """Test put option calculation."""
-        pricer = GarmanKohlhagenPricer()
-
         result = pricer.calculate_put_option(
             spot_rate=19.0,
             strike_price=18.0,  # Below spot (for exporter protection)
@@ -129,15 +144,13 @@ class TestGarmanKohlhagenPricer:
         )
 
         # Put option should have positive value
-        assert result["option_price"] > 0
+        assert result.option_price > 0
 
         # Delta should be negative for put
-        assert result["greeks"]["delta"] < 0
+        assert result.greeks.delta < 0
 
-    def test_expired_option(self):
+    def test_expired_option(self, pricer):
         """Test option at expiration (T=0)."""
-        pricer = GarmanKohlhagenPricer()
-
         # Call option in the money at expiration
         result_itm = pricer.calculate_call_option(
             spot_rate=20.0,
@@ -149,7 +162,7 @@ class TestGarmanKohlhagenPricer:
         )
 
         # Should equal intrinsic value
-        assert abs(result_itm["option_price"] - 1.0) < 0.01
+        assert abs(result_itm.option_price - 1.0) < 0.01
 
         # Call option out of the money at expiration
         result_otm = pricer.calculate_call_option(
@@ -162,12 +175,10 @@ class TestGarmanKohlhagenPricer:
         )
 
         # Should be worthless
-        assert result_otm["option_price"] == 0.0
+        assert result_otm.option_price == 0.0
 
-    def test_price_with_analytics_full_output(self):
+    def test_price_with_analytics_full_output(self, pricer):
         """Test the full analytics pricing function."""
-        pricer = GarmanKohlhagenPricer()
-
         result = pricer.price_with_analytics(
             spot_rate=19.0,
             strike_price=None,  # Will be calculated from protection_level
@@ -193,8 +204,11 @@ class TestGarmanKohlhagenPricer:
         assert result.greeks.gamma > 0
         assert result.greeks.vega > 0
 
-        # Verify scenarios are generated
+        # Verify scenarios are generated at the fixed spot shocks
         assert len(result.scenarios) == 5
+        assert [s.future_spot_rate for s in result.scenarios] == pytest.approx(
+            (19.0 * (1 + SCENARIO_SHOCKS)).tolist()
+        )
 
         # Verify payoff curve is generated
         assert len(result.payoff_curve) == 50
@@ -202,53 +216,58 @@ class TestGarmanKohlhagenPricer:
         # Breakeven rate should be above spot
         assert result.breakeven_rate > 19.0
 
-    def test_high_volatility_increases_price(self):
-        """Higher volatility should increase option price."""
-        pricer = GarmanKohlhagenPricer()
-
-        low_vol_result = pricer.calculate_call_option(
+    def test_price_with_analytics_piecewise_payoff(self, pricer):
+        """Piecewise payoff curve should have 3 points with the kink at the strike."""
+        result = pricer.price_with_analytics(
             spot_rate=19.0,
             strike_price=19.95,
             time_to_maturity_years=0.25,
-            volatility=0.10,  # Low volatility
+            volatility=0.20,
             domestic_rate=0.04,
             foreign_rate=0.07,
+            notional_amount=1000000,
+            option_type="call",
+            dense=False,
         )
 
+        # Dense sample is skipped on request
+        assert result.payoff_curve == []
+
+        low, kink, high = result.payoff_curve_piecewise
+        assert low.spot_rate == pytest.approx(19.0 * 0.85)
+        assert kink.spot_rate == pytest.approx(19.95)
+        assert high.spot_rate == pytest.approx(19.0 * 1.15)
+
+        # Option pays nothing up to the strike and then grows linearly
+        assert low.option_payoff == 0
+        assert kink.option_payoff == 0
+        assert high.option_payoff == pytest.approx((19.0 * 1.15 - 19.95) * 1000000)
+
+    def test_high_volatility_increases_price(self, pricer, reference_call):
+        """Higher volatility should increase option price."""
         high_vol_result = pricer.calculate_call_option(
             spot_rate=19.0,
             strike_price=19.95,
             time_to_maturity_years=0.25,
-            volatility=0.30,  # High volatility
+            volatility=0.30,  # High volatility (reference is 20%)
             domestic_rate=0.04,
             foreign_rate=0.07,
         )
 
-        assert high_vol_result["option_price"] > low_vol_result["option_price"]
+        assert high_vol_result.option_price > reference_call.option_price
 
-    def test_longer_maturity_increases_price(self):
+    def test_longer_maturity_increases_price(self, pricer, reference_call):
         """Longer time to maturity should increase option price."""
-        pricer = GarmanKohlhagenPricer()
-
-        short_maturity_result = pricer.calculate_call_option(
-            spot_rate=19.0,
-            strike_price=19.95,
-            time_to_maturity_years=0.08,  # ~1 month
-            volatility=0.20,
-            domestic_rate=0.04,
-            foreign_rate=0.07,
-        )
-
         long_maturity_result = pricer.calculate_call_option(
             spot_rate=19.0,
             strike_price=19.95,
-            time_to_maturity_years=1.0,  # 1 year
+            time_to_maturity_years=1.0,  # 1 year (reference is 3 months)
             volatility=0.20,
             domestic_rate=0.04,
             foreign_rate=0.07,
         )
 
-        assert long_maturity_result["option_price"] > short_maturity_result["option_price"]
+        assert long_maturity_result.option_price > reference_call.option_price
 
 
 if __name__ == "__main__":
@@ -71,6 +71,12 @@ export type PricingResponse = {
     option_payoff: number;
     net_pnl: number;
   }>;
+  payoff_curve_piecewise: Array<{
+    spot_rate: number;
+    unhedged_pnl: number;
+    option_payoff: number;
+    net_pnl: number;
+  }>;
   breakeven_rate: number;
 };
 